@@ -9,4 +9,10 @@ except ImportError:
 
 from fmu.sumo.explorer.explorer import Explorer
 from fmu.sumo.explorer.timefilter import TimeType, TimeFilter
+from fmu.sumo.explorer.cache import (
+    AggregationCache,
+    BlobCache,
+    SearchCache,
+)
+from fmu.sumo.explorer.surface_statistics import SurfaceAccumulator
 from fmu.sumo.explorer.objects.table_aggregated import AggregatedTable
@@ -0,0 +1,120 @@
+"""Module containing the query representation of document collections"""
+from typing import Dict, List, Union
+
+
+def _shape(value):
+    """Cheap hashable summary of a query value, equal for equal values
+
+    Lists are summarized by their length only, so large `terms` lists are
+    not walked.
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _shape(val)) for key, val in value.items())
+    if isinstance(value, list):
+        return (list, len(value))
+    return value
+
+
+def _extend_list(old: List, new: List) -> List:
+    index = {}
+    for val in old:
+        index.setdefault(_shape(val), []).append(val)
+
+    extended = list(old)
+
+    for val in new:
+        # Only values of the same shape can be equal
+        candidates = index.setdefault(_shape(val), [])
+        if val not in candidates:
+            candidates.append(val)
+            extended.append(val)
+
+    return extended
+
+
+def extend_query(old: Dict, new: Dict) -> Dict:
+    """Extend a query object, without modifying it
+
+    Dicts are merged recursively, lists are extended with values they do
+    not already hold, and other values are replaced. Only the dicts and
+    lists on the paths that change are copied, the rest is shared with
+    `old` and `new`, so neither should be modified afterwards.
+
+    Args:
+        old (Dict): old query object
+        new (Dict): new query object
+
+    Returns:
+        Dict: Extended query object
+    """
+    if new is None:
+        return old
+
+    extended = dict(old)
+
+    for key, val in new.items():
+        if key not in extended:
+            extended[key] = val
+        elif isinstance(val, dict) and isinstance(extended[key], dict):
+            extended[key] = extend_query(extended[key], val)
+        elif isinstance(val, list) and isinstance(extended[key], list):
+            extended[key] = _extend_list(extended[key], val)
+        else:
+            extended[key] = val
+
+    return extended
+
+
+class Query:
+    """Immutable query, made of a base query and the filters extending it
+
+    Extending a query only links the filter to it, so a chain of filters
+    costs nothing until the query object is needed for a request. The
+    query object is then built once, by `extend_query`, and kept.
+    """
+
+    __slots__ = ("_parent", "_patch", "_dict")
+
+    def __init__(
+        self, query: Union[Dict, "Query"], parent: "Query" = None
+    ) -> None:
+        """
+        Args:
+            query (Dict or Query): base query, or filter extending `parent`
+            parent (Query): query extended by `query`
+        """
+        self._parent = parent
+        self._patch = query
+        self._dict = None
+
+    def extend(self, query: Union[Dict, "Query"]) -> "Query":
+        """Extend the query with a filter
+
+        Args:
+            query (Dict or Query): filter to add, ignored if None
+
+        Returns:
+            Query: the extended query
+        """
+        if query is None:
+            return self
+
+        return Query(query, self)
+
+    def to_dict(self) -> Dict:
+        """Get the query object
+
+        Returns:
+            Dict: the query object, which should not be modified
+        """
+        if self._dict is None:
+            patch = self._patch
+            if isinstance(patch, Query):
+                patch = patch.to_dict()
+
+            if self._parent is None:
+                self._dict = patch
+            else:
+                self._dict = extend_query(self._parent.to_dict(), patch)
+
+        return self._dict
@@ -0,0 +1,46 @@
+"""Module containing coalescing of identical concurrent requests"""
+import asyncio
+import weakref
+from typing import Any, Awaitable, Callable, Hashable
+
+# In-flight requests by key, per event loop
+_in_flight = weakref.WeakKeyDictionary()
+
+
+def _forget(in_flight: dict, key: Hashable, future: asyncio.Future) -> None:
+    if in_flight.get(key) is future:
+        del in_flight[key]
+
+    # Mark the exception as retrieved, in case every caller was cancelled
+    if not future.cancelled():
+        future.exception()
+
+
+async def single_flight(
+    key: Hashable, request: Callable[[], Awaitable[Any]]
+) -> Any:
+    """Make a request, or join an identical request already in flight
+
+    Callers with the same key share one request, and all get its result
+    or its exception. A cancelled caller does not cancel the request for
+    the others. The result is shared, so it should not be modified.
+
+    Args:
+        key (Hashable): key identifying the request
+        request (Callable[[], Awaitable]): makes the request
+
+    Returns:
+        Any: result of the request
+    """
+    loop = asyncio.get_running_loop()
+    in_flight = _in_flight.setdefault(loop, {})
+    future = in_flight.get(key)
+
+    if future is None:
+        future = asyncio.ensure_future(request())
+        in_flight[key] = future
+        future.add_done_callback(
+            lambda done: _forget(in_flight, key, done)
+        )
+
+    return await asyncio.shield(future)
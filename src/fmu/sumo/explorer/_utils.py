@@ -1,16 +1,104 @@
 """Module containing utility class"""
-from typing import List, Dict
+from typing import List, Dict, Iterator, AsyncIterator
+import asyncio
+import hashlib
 import json
+import re
+import uuid
+import weakref
 from sumo.wrapper import SumoClient
-
-def _build_bucket_query(query, field):
+from fmu.sumo.explorer._query import extend_query
+from fmu.sumo.explorer.cache import SearchCache, get_search_cache
+from fmu.sumo.explorer._single_flight import single_flight
+
+_MAX_IDS_PER_QUERY = 1000
+
+# Composite aggregation page size, within the default search.max_buckets
+_BUCKET_PAGE_SIZE = 10000
+
+# Largest page allowed by the default index.max_result_window
+_MAX_IDS_PER_PAGE = 10000
+
+_TIME_UNITS = {"ms": 0.001, "s": 1, "m": 60, "h": 3600, "d": 86400}
+
+_client_scopes = weakref.WeakKeyDictionary()
+
+def _canonical_terms(terms):
+    # The order and duplicates of terms values do not change the result
+    canonical = {}
+    for field, values in terms.items():
+        if isinstance(values, list) and all(
+            isinstance(val, (str, int, float)) for val in values
+        ):
+            canonical[field] = sorted(
+                set(values), key=lambda val: (type(val).__name__, val)
+            )
+        else:
+            canonical[field] = _canonical_query(values)
+    return canonical
+
+def _canonical_query(value):
+    if isinstance(value, dict):
+        return {
+            key: (
+                _canonical_terms(val)
+                if key == "terms" and isinstance(val, dict)
+                else _canonical_query(val)
+            )
+            for key, val in value.items()
+        }
+    if isinstance(value, list):
+        return [_canonical_query(val) for val in value]
+    return value
+
+def _client_scope(sumo):
+    """Scope of responses to searches made by a client
+
+    Search results depend on the access rights of the client, so the
+    responses to one client are not given to another.
+    """
+    try:
+        scope = _client_scopes.get(sumo)
+        if scope is None:
+            scope = _client_scopes[sumo] = uuid.uuid4().hex
+        return scope
+    except TypeError:
+        # Not weak referenceable, fall back to the object identity
+        return str(id(sumo))
+
+def _search_key(query, scope=""):
+    """Key of a search in the search cache
+
+    The key covers the whole search body, including any point in time,
+    and the scope of the response.
+    """
+    canonical = json.dumps(
+        _canonical_query(query), sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256((scope + canonical).encode()).hexdigest()
+
+def _search_ttl(query):
+    """Lifetime of a cached search response, None for the default
+
+    Results within a point in time do not change, so they are kept for as
+    long as the point in time is kept alive by the search.
+    """
+    keep_alive = query.get("pit", {}).get("keep_alive")
+    if keep_alive is None:
+        return None
+    match = re.fullmatch(r"(\d+)(ms|s|m|h|d)", keep_alive.strip())
+    if match is None:
+        return None
+    return int(match[1]) * _TIME_UNITS[match[2]]
+
+def _build_bucket_query(query, field, size=_BUCKET_PAGE_SIZE):
     return {
         "size": 0,
         "query": query,
         "aggs": {
             f"{field}": {
                 "composite": {
-                    "size": 1000,
+                    "size": size,
                     "sources": [
                         {
                             f"{field}": {
@@ -31,17 +119,192 @@ def _set_after_key(query, field, after_key):
         pass
     return query
 
+def _facet_page_size(fields, size):
+    """Share the buckets of a facet request between its fields, so that
+    the request stays within search.max_buckets
+    """
+    return max(size // len(fields), 1)
+
+def _build_facet_query(query, fields, after_keys, size):
+    facet_query = {"size": 0, "query": query, "aggs": {}}
+    for field in fields:
+        bucket_query = _build_bucket_query(query, field, size)
+        bucket_query = _set_after_key(bucket_query, field, after_keys[field])
+        facet_query["aggs"].update(bucket_query["aggs"])
+    return facet_query
+
+def _read_bucket_page(res, field, size):
+    """Read buckets and the after key of the next page from a response
+
+    The after key is None after the last page, so paging stops without
+    an extra round trip for an empty page.
+    """
+    agg = res["aggregations"][field]
+    buckets = [
+        {"key": bucket["key"][field], "doc_count": bucket["doc_count"]}
+        for bucket in agg["buckets"]
+    ]
+    after_key = agg.get("after_key")
+    if len(buckets) < size:
+        after_key = None
+    return buckets, after_key
+
+def _build_ids_queries(ids, select):
+    ids = list(dict.fromkeys(ids))
+    queries = []
+    for start in range(0, len(ids), _MAX_IDS_PER_QUERY):
+        chunk = ids[start : start + _MAX_IDS_PER_QUERY]
+        query = {"query": {"ids": {"values": chunk}}, "size": len(chunk)}
+        if select is not None:
+            query["_source"] = select
+        queries.append(query)
+    return queries
+
+def _build_ids_page_query(query, after):
+    page_query = {
+        "query": query,
+        "sort": [{"_doc": {"order": "desc"}}],
+        "size": _MAX_IDS_PER_PAGE,
+        "_source": False,
+    }
+    if after is not None:
+        page_query["search_after"] = after
+    return page_query
+
 class Utils:
     """A class with utility functions for communicating with Sumo API"""
 
     def __init__(self, sumo: SumoClient) -> None:
         self._sumo = sumo
 
+    def search(self, query: Dict) -> Dict:
+        """Search, through the search cache if enabled
+
+        Args:
+            query (Dict): search body
+
+        Returns:
+            Dict: search response
+        """
+        cache = get_search_cache()
+
+        if cache is None:
+            return self._sumo.post("/search", json=query).json()
+
+        key = self._search_key(query, cache)
+        content = cache.get(key)
+
+        if content is None:
+            content = self._sumo.post("/search", json=query).content
+            cache.put(key, content, _search_ttl(query))
+
+        return json.loads(content)
+
+    async def search_async(self, query: Dict) -> Dict:
+        """Search, through the search cache if enabled
+
+        Identical searches made concurrently by this client share one
+        request.
+
+        Args:
+            query (Dict): search body
+
+        Returns:
+            Dict: search response
+        """
+        key = _search_key(query, _client_scope(self._sumo))
+        content = await single_flight(
+            ("search", key), lambda: self._search_content_async(query)
+        )
+
+        return json.loads(content)
+
+    async def _search_content_async(self, query: Dict) -> bytes:
+        cache = get_search_cache()
+
+        if cache is None:
+            res = await self._sumo.post_async("/search", json=query)
+            return res.content
+
+        key = self._search_key(query, cache)
+        content = cache.get(key)
+
+        if content is None:
+            res = await self._sumo.post_async("/search", json=query)
+            content = res.content
+            cache.put(key, content, _search_ttl(query))
+
+        return content
+
+    def _search_key(self, query: Dict, cache: SearchCache) -> str:
+        scope = "" if cache.shared else _client_scope(self._sumo)
+        return _search_key(query, scope)
+
+    def iter_buckets(
+        self,
+        field: str,
+        query: Dict,
+        size: int = _BUCKET_PAGE_SIZE,
+    ) -> Iterator[Dict]:
+        """Iterate over buckets, one page of buckets at a time
+
+        Arguments:
+            - field (str): a field in the metadata
+            - query (List[Dict] or None): filter options
+            - size (int): number of buckets per page
+
+        Returns:
+            An iterator over buckets of unique values for a given field
+        """
+        query = _build_bucket_query(query, field, size)
+        after_key = None
+
+        while True:
+            query = _set_after_key(query, field, after_key)
+            res = self.search(query)
+            buckets, after_key = _read_bucket_page(res, field, size)
+            yield from buckets
+
+            if after_key is None:
+                return
+
+    async def iter_buckets_async(
+        self,
+        field: str,
+        query: Dict,
+        size: int = _BUCKET_PAGE_SIZE,
+    ) -> AsyncIterator[Dict]:
+        """Iterate over buckets, one page of buckets at a time
+
+        Arguments:
+            - field (str): a field in the metadata
+            - query (List[Dict] or None): filter options
+            - size (int): number of buckets per page
+
+        Returns:
+            An async iterator over buckets of unique values for a given
+            field
+        """
+        query = _build_bucket_query(query, field, size)
+        after_key = None
+
+        while True:
+            query = _set_after_key(query, field, after_key)
+            res = await self.search_async(query)
+            buckets, after_key = _read_bucket_page(res, field, size)
+
+            for bucket in buckets:
+                yield bucket
+
+            if after_key is None:
+                return
+
     def get_buckets(
         self,
         field: str,
         query: Dict,
         sort: List = None,
+        size: int = _BUCKET_PAGE_SIZE,
     ) -> List[Dict]:
         """Get a List of buckets
 
@@ -49,32 +312,19 @@ class Utils:
             - field (str): a field in the metadata
             - query (List[Dict] or None): filter options
             - sort (List or None): sorting options
+            - size (int): number of buckets per page
 
         Returns:
             A List of unique values for a given field
         """
-
-        query = _build_bucket_query(query, field)
-        all_buckets = []
-        after_key = None
-        while True:
-            query = _set_after_key(query, field, after_key)
-            res = self._sumo.post("/search", json=query).json()
-            buckets = res["aggregations"][field]["buckets"]
-            if len(buckets) == 0:
-                break
-            after_key = res["aggregations"][field]["after_key"]
-            buckets = [{"key": bucket["key"][field], "doc_count": bucket["doc_count"]} for bucket in buckets]
-            all_buckets = all_buckets + buckets
-            pass
-
-        return all_buckets
+        return list(self.iter_buckets(field, query, size))
 
     async def get_buckets_async(
         self,
         field: str,
         query: Dict,
         sort: List = None,
+        size: int = _BUCKET_PAGE_SIZE,
     ) -> List[Dict]:
         """Get a List of buckets
 
@@ -82,27 +332,100 @@ class Utils:
             - field (str): a field in the metadata
             - query (List[Dict] or None): filter options
             - sort (List or None): sorting options
+            - size (int): number of buckets per page
 
         Returns:
             A List of unique values for a given field
         """
+        return [
+            bucket
+            async for bucket in self.iter_buckets_async(field, query, size)
+        ]
 
-        query = _build_bucket_query(query, field)
-        all_buckets = []
-        after_key = None
-        while True:
-            query = _set_after_key(query, field, after_key)
-            res = await self._sumo.post_async("/search", json=query)
-            res = res.json()
-            buckets = res["aggregations"][field]["buckets"]
-            if len(buckets) == 0:
-                break
-            after_key = res["aggregations"][field]["after_key"]
-            buckets = [{"key": bucket["key"][field], "doc_count": bucket["doc_count"]} for bucket in buckets]
-            all_buckets = all_buckets + buckets
-            pass
+    def get_facets(
+        self,
+        fields: List[str],
+        query: Dict,
+        size: int = _BUCKET_PAGE_SIZE,
+    ) -> Dict[str, List[Dict]]:
+        """Get buckets for several fields in one request
+
+        Each field gets its own composite aggregation, with an equal
+        share of the `size` buckets of a request. Fields with more
+        buckets than fit in one page are paged further, together, while
+        the other fields are left out of the following requests.
+
+        Arguments:
+            - fields (List[str]): fields in the metadata
+            - query (List[Dict] or None): filter options
+            - size (int): number of buckets per request, for all fields
 
-        return all_buckets
+        Returns:
+            A List of buckets of unique values by field
+        """
+        fields = list(dict.fromkeys(fields))
+        facets = {field: [] for field in fields}
+        after_keys = {field: None for field in fields}
+
+        while len(fields) > 0:
+            page_size = _facet_page_size(fields, size)
+            facet_query = _build_facet_query(
+                query, fields, after_keys, page_size
+            )
+            res = self.search(facet_query)
+            fields = self._read_facets(
+                res, fields, facets, after_keys, page_size
+            )
+
+        return facets
+
+    async def get_facets_async(
+        self,
+        fields: List[str],
+        query: Dict,
+        size: int = _BUCKET_PAGE_SIZE,
+    ) -> Dict[str, List[Dict]]:
+        """Get buckets for several fields in one request
+
+        Arguments:
+            - fields (List[str]): fields in the metadata
+            - query (List[Dict] or None): filter options
+            - size (int): number of buckets per request, for all fields
+
+        Returns:
+            A List of buckets of unique values by field
+        """
+        fields = list(dict.fromkeys(fields))
+        facets = {field: [] for field in fields}
+        after_keys = {field: None for field in fields}
+
+        while len(fields) > 0:
+            page_size = _facet_page_size(fields, size)
+            facet_query = _build_facet_query(
+                query, fields, after_keys, page_size
+            )
+            res = await self.search_async(facet_query)
+            fields = self._read_facets(
+                res, fields, facets, after_keys, page_size
+            )
+
+        return facets
+
+    @staticmethod
+    def _read_facets(res, fields, facets, after_keys, size) -> List[str]:
+        """Add a page of buckets to each facet
+
+        Returns:
+            The fields that have more pages
+        """
+        remaining = []
+        for field in fields:
+            buckets, after_key = _read_bucket_page(res, field, size)
+            facets[field].extend(buckets)
+            if after_key is not None:
+                after_keys[field] = after_key
+                remaining.append(field)
+        return remaining
 
     def get_objects(
         self,
@@ -125,9 +448,9 @@ class Utils:
         if select is not None:
             query["_source"] = select
 
-        res = self._sumo.post("/search", json=query)
+        res = self.search(query)
 
-        return res.json()["hits"]["hits"]
+        return res["hits"]["hits"]
 
     async def get_objects_async(
         self,
@@ -150,9 +473,9 @@ class Utils:
         if select is not None:
             query["_source"] = select
 
-        res = await self._sumo.post_async("/search", json=query)
+        res = await self.search_async(query)
 
-        return res.json()["hits"]["hits"]
+        return res["hits"]["hits"]
 
     def get_object(self, uuid: str, select: List[str] = None) -> Dict:
         """Get metadata object by uuid
@@ -173,8 +496,8 @@ class Utils:
         if select is not None:
             query["_source"] = select
 
-        res = self._sumo.post("/search", json=query)
-        hits = res.json()["hits"]["hits"]
+        res = self.search(query)
+        hits = res["hits"]["hits"]
 
         if len(hits) == 0:
             raise Exception(f"Document not found: {uuid}")
@@ -200,17 +523,115 @@ class Utils:
         if select is not None:
             query["_source"] = select
 
-        res = await self._sumo.post_async("/search", json=query)
-        hits = res.json()["hits"]["hits"]
+        res = await self.search_async(query)
+        hits = res["hits"]["hits"]
 
         if len(hits) == 0:
             raise Exception(f"Document not found: {uuid}")
 
         return hits[0]
 
+    def get_objects_by_ids(
+        self, ids: List[str], select: List[str] = None
+    ) -> List[Dict]:
+        """Get metadata objects by uuids
+
+        The uuids are looked up with `ids` queries, in chunks of at most
+        _MAX_IDS_PER_QUERY uuids. Uuids that are not found are left out.
+
+        Args:
+            ids (List[str]): uuids of metadata objects
+            select (List[str]): list of metadata fields to return
+
+        Returns:
+            List[Dict]: A List of metadata objects
+        """
+        hits = []
+
+        for query in _build_ids_queries(ids, select):
+            res = self.search(query)
+            hits.extend(res["hits"]["hits"])
+
+        return hits
+
+    async def get_objects_by_ids_async(
+        self, ids: List[str], select: List[str] = None
+    ) -> List[Dict]:
+        """Get metadata objects by uuids
+
+        The chunks are looked up concurrently.
+
+        Args:
+            ids (List[str]): uuids of metadata objects
+            select (List[str]): list of metadata fields to return
+
+        Returns:
+            List[Dict]: A List of metadata objects
+        """
+        responses = await asyncio.gather(
+            *[
+                self.search_async(query)
+                for query in _build_ids_queries(ids, select)
+            ]
+        )
+
+        return [hit for res in responses for hit in res["hits"]["hits"]]
+
+    def get_object_ids(self, query: Dict) -> List[str]:
+        """Get uuids of all objects matching a query
+
+        The result is paged through with `search_after`, without fetching
+        any metadata, so there is no cap on the number of uuids.
+
+        Args:
+            query (Dict): filter options
+
+        Returns:
+            List[str]: A List of uuids
+        """
+        ids = []
+        after = None
+
+        while True:
+            res = self.search(_build_ids_page_query(query, after))
+            hits = res["hits"]["hits"]
+            ids.extend(hit["_id"] for hit in hits)
+
+            if len(hits) < _MAX_IDS_PER_PAGE:
+                return ids
+
+            after = hits[-1]["sort"]
+
+    async def get_object_ids_async(self, query: Dict) -> List[str]:
+        """Get uuids of all objects matching a query
+
+        Args:
+            query (Dict): filter options
+
+        Returns:
+            List[str]: A List of uuids
+        """
+        ids = []
+        after = None
+
+        while True:
+            res = await self.search_async(
+                _build_ids_page_query(query, after)
+            )
+            hits = res["hits"]["hits"]
+            ids.extend(hit["_id"] for hit in hits)
+
+            if len(hits) < _MAX_IDS_PER_PAGE:
+                return ids
+
+            after = hits[-1]["sort"]
+
     def extend_query_object(self, old: Dict, new: Dict) -> Dict:
         """Extend query object
 
+        The old query object is not modified, but shares the parts that
+        are not extended with the extended query object.
+
         Args:
             old (Dict): old query object
             new (Dict): new query object
@@ -218,27 +639,7 @@ class Utils:
         Returns:
             Dict: Extended query object
         """
-        return_value = old
-        if new is not None:
-            stringified = json.dumps(old)
-            extended = json.loads(stringified)
-
-            for key in new:
-                if key in extended:
-                    if isinstance(new[key], dict):
-                        extended[key] = self.extend_query_object(
-                            extended[key], new[key]
-                        )
-                    elif isinstance(new[key], list):
-                        for val in new[key]:
-                            if val not in extended[key]:
-                                extended[key].append(val)
-                    else:
-                        extended[key] = new[key]
-                else:
-                    extended[key] = new[key]
-            return_value = extended
-        return return_value
+        return extend_query(old, new)
 
     def build_terms(self, keys_vals: Dict) -> List[Dict]:
         """Build a list of term objects
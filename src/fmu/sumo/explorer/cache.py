@@ -0,0 +1,459 @@
+"""Module containing caches shared by all explorer objects in a process"""
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+
+_blob_cache = None
+_search_cache = None
+
+# Max time between scans of a blob cache directory, in seconds, so that
+# blobs written by other processes are accounted for
+_SCAN_INTERVAL = 60.0
+
+# Eviction frees room below the max size, so a full cache is not scanned
+# again on every write
+_EVICT_RATIO = 0.9
+
+
+def _touch(path):
+    # The modification time is used as last access time for LRU. It is set
+    # explicitly, since file system clocks may be too coarse to order
+    # accesses made in quick succession.
+    now = time.time_ns()
+    os.utime(path, ns=(now, now))
+
+
+class BlobCache:
+    """Persistent on-disk cache of object blobs
+
+    Blobs are stored under a key made of the object uuid and the checksum
+    of the blob, so a cached blob is never stale. When the total size of
+    the cache exceeds `max_size`, the least recently used blobs are
+    evicted.
+
+    Several processes on the same node can share a cache directory:
+    blobs are written to a temporary file and atomically renamed into
+    place, and blobs evicted by another process are simply cache misses.
+
+    The total size is tracked as blobs are written, and the directory is
+    only scanned when the size may exceed `max_size`, or when the last scan
+    is too old to account for the blobs written by other processes.
+    """
+
+    def __init__(self, directory: str, max_size: int = 10 * 1024**3):
+        """Init
+
+        Args:
+            directory (str): cache directory, created if missing
+            max_size (int): max total size of cached blobs, in bytes
+        """
+        self._dir = Path(directory)
+        self._max_size = max_size
+        self._size = None
+        self._scanned = 0.0
+        self._lock = threading.Lock()
+        self._dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, uuid: str, checksum: str) -> Path:
+        return self._dir / uuid[:2] / f"{uuid}-{checksum}"
+
+    def contains(self, uuid: str, checksum: str) -> bool:
+        """Check if a blob is cached
+
+        Args:
+            uuid (str): object uuid
+            checksum (str): checksum of the object blob
+
+        Returns:
+            bool: True if the blob is cached
+        """
+        return self._path(uuid, checksum).exists()
+
+    def get(self, uuid: str, checksum: str) -> bytes:
+        """Get a cached blob
+
+        Args:
+            uuid (str): object uuid
+            checksum (str): checksum of the object blob
+
+        Returns:
+            bytes: the blob, or None if it is not cached
+        """
+        path = self._path(uuid, checksum)
+
+        try:
+            with open(path, "rb") as blob_file:
+                content = blob_file.read()
+        except OSError:
+            return None
+
+        try:
+            _touch(path)
+        except OSError:
+            pass
+
+        return content
+
+    def put(self, uuid: str, checksum: str, content: bytes) -> None:
+        """Add a blob to the cache, evicting old blobs if needed
+
+        Args:
+            uuid (str): object uuid
+            checksum (str): checksum of the object blob
+            content (bytes): the blob
+        """
+        if len(content) > self._max_size:
+            return
+
+        path = self._path(uuid, checksum)
+        path.parent.mkdir(exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=".", suffix=".tmp"
+        )
+
+        try:
+            replaced = path.stat().st_size
+        except OSError:
+            replaced = 0
+
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(content)
+            os.replace(tmp_path, path)
+            _touch(path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            if self._size is not None:
+                self._size += len(content) - replaced
+
+            scan = (
+                self._size is None
+                or self._size > self._max_size
+                or time.monotonic() - self._scanned > _SCAN_INTERVAL
+            )
+
+        if scan:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used blobs until well below max size"""
+        entries = []
+
+        for path in self._dir.glob("*/*"):
+            if path.name.startswith("."):
+                continue
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        size = sum(entry[1] for entry in entries)
+        target = self._max_size
+        if size > self._max_size:
+            target = self._max_size * _EVICT_RATIO
+
+        for _, entry_size, path in sorted(entries):
+            if size <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            size -= entry_size
+
+        with self._lock:
+            self._size = size
+            self._scanned = time.monotonic()
+
+
+def set_blob_cache(cache: BlobCache) -> None:
+    """Set the blob cache used by all objects, None disables caching
+
+    Args:
+        cache (BlobCache): blob cache
+    """
+    global _blob_cache
+    _blob_cache = cache
+
+
+def get_blob_cache() -> BlobCache:
+    """Get the blob cache used by all objects
+
+    Returns:
+        BlobCache: blob cache, or None if caching is disabled
+    """
+    return _blob_cache
+
+
+class AggregationCache:
+    """Cache of aggregation results, shared by all collections
+
+    Results are kept in memory, and the least recently used results are
+    evicted when their total size exceeds `max_size`. With a directory,
+    results are also persisted on disk, in a `BlobCache` bounded by
+    `max_disk_size`, so they survive restarts and can be shared by the
+    processes of a server.
+
+    Keys are made by the caller from the aggregated object ids and the
+    operation, so equivalent collections share results however they were
+    filtered.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 256 * 1024**2,
+        directory: str = None,
+        max_disk_size: int = 10 * 1024**3,
+    ):
+        """Init
+
+        Args:
+            max_size (int): max total size of results in memory, in bytes
+            directory (str): directory for persisting results, results
+                are kept in memory only if None
+            max_disk_size (int): max total size of results on disk, in
+                bytes
+        """
+        self._max_size = max_size
+        self._size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = (
+            None if directory is None else BlobCache(directory, max_disk_size)
+        )
+
+    def get(self, key: str, operation: str) -> bytes:
+        """Get a cached result
+
+        Args:
+            key (str): key of the aggregated objects
+            operation (str): aggregation operation
+
+        Returns:
+            bytes: the result, or None if it is not cached
+        """
+        with self._lock:
+            content = self._entries.get((key, operation))
+
+            if content is not None:
+                self._entries.move_to_end((key, operation))
+                return content
+
+        if self._disk is None:
+            return None
+
+        content = self._disk.get(key, operation)
+
+        if content is not None:
+            self._put_memory(key, operation, content)
+
+        return content
+
+    def put(self, key: str, operation: str, content: bytes) -> None:
+        """Add a result to the cache, evicting old results if needed
+
+        Args:
+            key (str): key of the aggregated objects
+            operation (str): aggregation operation
+            content (bytes): the result
+        """
+        self._put_memory(key, operation, content)
+
+        if self._disk is not None:
+            self._disk.put(key, operation, content)
+
+    def _put_memory(self, key: str, operation: str, content: bytes) -> None:
+        if len(content) > self._max_size:
+            return
+
+        with self._lock:
+            previous = self._entries.pop((key, operation), None)
+            if previous is not None:
+                self._size -= len(previous)
+
+            self._entries[(key, operation)] = content
+            self._size += len(content)
+
+            while self._size > self._max_size:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        """Remove all results from memory"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_aggregation_cache = AggregationCache()
+
+
+def set_aggregation_cache(cache: AggregationCache) -> None:
+    """Set the aggregation cache used by all collections, None disables
+    caching
+
+    Args:
+        cache (AggregationCache): aggregation cache
+    """
+    global _aggregation_cache
+    _aggregation_cache = cache
+
+
+def get_aggregation_cache() -> AggregationCache:
+    """Get the aggregation cache used by all collections
+
+    Returns:
+        AggregationCache: aggregation cache, or None if caching is disabled
+    """
+    return _aggregation_cache
+
+
+class SearchCache:
+    """Cache of search responses
+
+    Responses are kept in memory for `ttl` seconds, or as long as given
+    when added, and the least recently used responses are evicted beyond
+    `max_entries`. With a directory, responses are also persisted on disk,
+    in a `BlobCache` bounded by `max_disk_size`.
+
+    Responses are stored as returned by Sumo, so callers get their own
+    copy of the response on every hit.
+
+    Since responses depend on the access rights of the user, responses are
+    only reused by the Sumo client that got them, unless the cache is
+    `shared`. Share the cache only when all clients of the process act for
+    the same user, for example to reuse persisted responses across runs of
+    a batch job.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        max_entries: int = 1000,
+        directory: str = None,
+        max_disk_size: int = 1024**3,
+        shared: bool = False,
+    ):
+        """Init
+
+        Args:
+            ttl (float): default lifetime of responses, in seconds
+            max_entries (int): max number of responses in memory
+            directory (str): directory for persisting responses, responses
+                are kept in memory only if None
+            max_disk_size (int): max total size of responses on disk, in
+                bytes
+            shared (bool): reuse responses across Sumo clients
+        """
+        self._shared = shared
+        self._ttl = ttl
+        self._max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._disk = (
+            None if directory is None else BlobCache(directory, max_disk_size)
+        )
+
+    @property
+    def shared(self) -> bool:
+        """True if responses are reused across Sumo clients"""
+        return self._shared
+
+    def get(self, key: str) -> bytes:
+        """Get a cached response
+
+        Args:
+            key (str): key of the search
+
+        Returns:
+            bytes: the response, or None if it is not cached or expired
+        """
+        now = time.time()
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                return entry[1]
+
+            self._entries.pop(key, None)
+
+        if self._disk is None:
+            return None
+
+        stored = self._disk.get(key, "search")
+
+        if stored is None:
+            return None
+
+        # Stored responses are prefixed by their expiry time
+        (expires,) = struct.unpack_from(">d", stored)
+
+        if expires <= now:
+            return None
+
+        content = stored[8:]
+        self._put_memory(key, content, expires)
+
+        return content
+
+    def put(self, key: str, content: bytes, ttl: float = None) -> None:
+        """Add a response to the cache
+
+        Args:
+            key (str): key of the search
+            content (bytes): the response
+            ttl (float): lifetime of the response, in seconds, the default
+                lifetime if None
+        """
+        expires = time.time() + (self._ttl if ttl is None else ttl)
+        self._put_memory(key, content, expires)
+
+        if self._disk is not None:
+            stored = struct.pack(">d", expires) + content
+            self._disk.put(key, "search", stored)
+
+    def _put_memory(self, key: str, content: bytes, expires: float) -> None:
+        with self._lock:
+            self._entries[key] = (expires, content)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all responses from memory"""
+        with self._lock:
+            self._entries.clear()
+
+
+def set_search_cache(cache: SearchCache) -> None:
+    """Set the search cache used by all objects, None disables caching
+
+    Args:
+        cache (SearchCache): search cache
+    """
+    global _search_cache
+    _search_cache = cache
+
+
+def get_search_cache() -> SearchCache:
+    """Get the search cache used by all objects
+
+    Returns:
+        SearchCache: search cache, or None if caching is disabled
+    """
+    return _search_cache
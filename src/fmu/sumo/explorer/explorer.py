@@ -1,17 +1,37 @@
 """Module containing class for exploring results from sumo"""
+from typing import Dict, List
 from sumo.wrapper import SumoClient
 from fmu.sumo.explorer.pit import Pit
+from fmu.sumo.explorer.cache import (
+    AggregationCache,
+    BlobCache,
+    SearchCache,
+    set_aggregation_cache,
+    set_blob_cache,
+    set_search_cache,
+)
 from fmu.sumo.explorer.objects.case_collection import (
     CaseCollection,
     _CASE_FIELDS,
 )
 from fmu.sumo.explorer.objects._child_collection import _CHILD_FIELDS
+from fmu.sumo.explorer.objects._child import Child
 from fmu.sumo.explorer.objects.surface import Surface
 from fmu.sumo.explorer.objects.polygons import Polygons
 from fmu.sumo.explorer.objects.table import Table
+from fmu.sumo.explorer.objects.cube import Cube
+from fmu.sumo.explorer.objects.dictionary import Dictionary
 from fmu.sumo.explorer.objects.case import Case
 from fmu.sumo.explorer._utils import Utils
 
+_CHILD_TYPES = {
+    "surface": Surface,
+    "polygons": Polygons,
+    "table": Table,
+    "cube": Cube,
+    "dictionary": Dictionary,
+}
+
 
 class Explorer:
     """Class for consuming FMU results from Sumo.
@@ -33,6 +53,9 @@ class Explorer:
         token: str = None,
         interactive: bool = True,
         keep_alive: str = None,
+        blob_cache: BlobCache = None,
+        aggregation_cache: AggregationCache = None,
+        search_cache: SearchCache = None,
     ):
         """Initialize the Explorer class
 
@@ -55,16 +78,41 @@ class Explorer:
         Every request to Sumo will extend the lifespan of the snapshot
         by the time specified in `keep_alive`.
 
+        Use the `blob_cache` argument to keep downloaded blobs on disk
+        and reuse them across sessions and processes. The cache is
+        process-wide, and is used by all objects reading blobs.
+
+        Surface aggregation results are cached in memory by default. Use
+        the `aggregation_cache` argument to configure that cache, for
+        example to persist results on disk.
+
+        Use the `search_cache` argument to reuse search responses across
+        collections and objects. Searches within a `keep_alive` snapshot
+        are cached for as long as the snapshot lives.
+
         Args:
             env (str): Sumo environment
             token (str): authenticate with existing token
             interactive (bool): authenticate using interactive flow (browser)
             keep_alive (str): point in time lifespan
+            blob_cache (BlobCache): on-disk cache for object blobs
+            aggregation_cache (AggregationCache): cache for aggregation
+                results
+            search_cache (SearchCache): cache for search responses
         """
         self._sumo = SumoClient(env, token=token, interactive=interactive)
         self._pit = Pit(self._sumo, keep_alive) if keep_alive else None
         self._utils = Utils(self._sumo)
 
+        if blob_cache is not None:
+            set_blob_cache(blob_cache)
+
+        if aggregation_cache is not None:
+            set_aggregation_cache(aggregation_cache)
+
+        if search_cache is not None:
+            set_search_cache(search_cache)
+
     @property
     def cases(self):
         """Cases in Sumo"""
@@ -206,3 +254,55 @@ class Explorer:
         """
         metadata = await self._utils.get_object_async(uuid, _CHILD_FIELDS)
         return Table(self._sumo, metadata)
+
+    def get_objects_by_uuids(self, uuids: List[str]) -> List[Child]:
+        """Get child objects by uuids
+
+        The objects are looked up with a few batched queries, and are
+        returned as Surface, Polygons, Table, Cube or Dictionary objects
+        depending on their class.
+
+        Args:
+            uuids (List[str]): object uuids
+
+        Returns:
+            List[Child]: objects, in the same order as `uuids`
+        """
+        hits = self._utils.get_objects_by_ids(uuids, _CHILD_FIELDS)
+        return self._make_child_objects(uuids, hits)
+
+    async def get_objects_by_uuids_async(
+        self, uuids: List[str]
+    ) -> List[Child]:
+        """Get child objects by uuids
+
+        Args:
+            uuids (List[str]): object uuids
+
+        Returns:
+            List[Child]: objects, in the same order as `uuids`
+        """
+        hits = await self._utils.get_objects_by_ids_async(
+            uuids, _CHILD_FIELDS
+        )
+        return self._make_child_objects(uuids, hits)
+
+    def _make_child_objects(
+        self, uuids: List[str], hits: List[Dict]
+    ) -> List[Child]:
+        docs = {hit["_id"]: hit for hit in hits}
+        objects = []
+
+        for uuid in uuids:
+            if uuid not in docs:
+                raise Exception(f"Document not found: {uuid}")
+
+            doc = docs[uuid]
+            doc_class = doc["_source"]["class"]
+
+            if doc_class not in _CHILD_TYPES:
+                raise Exception(f"Unsupported object class: {doc_class}")
+
+            objects.append(_CHILD_TYPES[doc_class](self._sumo, doc))
+
+        return objects
@@ -1,24 +1,73 @@
 """module containing class for child object"""
 
-from typing import Dict
+from fnmatch import fnmatchcase
+from typing import Dict, List
 from io import BytesIO
 from sumo.wrapper import SumoClient
+from fmu.sumo.explorer._utils import Utils, _client_scope
+from fmu.sumo.explorer._single_flight import single_flight
+from fmu.sumo.explorer.cache import get_blob_cache
 from fmu.sumo.explorer.objects._document import Document
 
+_CHILD_FIELDS = {
+    "include": [],
+    "exclude": ["data.spec.columns", "fmu.realization.parameters"],
+}
+
 
 class Child(Document):
     """Class representing a child object in Sumo"""
 
-    def __init__(self, sumo: SumoClient, metadata: Dict) -> None:
+    def __init__(
+        self, sumo: SumoClient, metadata: Dict, select: List[str] = None
+    ) -> None:
         """
         Args:
             sumo (SumoClient): connection to Sumo
             metadata: (dict): child object metadata
+            select (List[str]): metadata fields fetched, if not all
         """
         super().__init__(metadata)
         self._sumo = sumo
+        self._select = select
         self._blob = None
 
+    def _load_metadata(self) -> None:
+        """Replace selected metadata fields with the full metadata"""
+        doc = Utils(self._sumo).get_object(self.uuid, _CHILD_FIELDS)
+        self._metadata = doc["_source"]
+        self._select = None
+
+    def _is_selected(self, path: List[str]) -> bool:
+        """Check if a metadata path was fetched, as a selected field or
+        within one, so that a missing value is really missing
+        """
+        if self._select is None:
+            return True
+
+        prefixes = [".".join(path[:end]) for end in range(1, len(path) + 1)]
+
+        return any(
+            fnmatchcase(prefix, field)
+            for field in self._select
+            for prefix in prefixes
+        )
+
+    def _get_property(self, path: List[str]):
+        value = super()._get_property(path)
+
+        if value is None and not self._is_selected(path):
+            self._load_metadata()
+            value = super()._get_property(path)
+
+        return value
+
+    def __getitem__(self, key: str):
+        if key not in self._metadata and not self._is_selected([key]):
+            self._load_metadata()
+
+        return super().__getitem__(key)
+
     @property
     def name(self) -> str:
         """Object name"""
@@ -89,8 +138,7 @@ class Child(Document):
     def blob(self) -> BytesIO:
         """Object blob"""
         if self._blob is None:
-            res = self._sumo.get(f"/objects('{self.uuid}')/blob")
-            self._blob = BytesIO(res.content)
+            self._blob = BytesIO(self._get_blob_content())
 
         return self._blob
 
@@ -98,7 +146,73 @@ class Child(Document):
     async def blob_async(self) -> BytesIO:
         """Object blob"""
         if self._blob is None:
-            res = await self._sumo.get_async(f"/objects('{self.uuid}')/blob")
-            self._blob = BytesIO(res.content)
+            self._blob = BytesIO(await self._get_blob_content_async())
 
         return self._blob
+
+    def _blob_checksum(self) -> str:
+        """Checksum identifying the blob contents, if known"""
+        # Read from the metadata at hand, selected fields or not, rather
+        # than fetching the full metadata just to find a cache key
+        checksum = Document._get_property(self, ["_sumo", "blob_md5"])
+
+        if checksum is None:
+            checksum = Document._get_property(
+                self, ["file", "checksum_md5"]
+            )
+
+        return checksum
+
+    def _is_blob_local(self) -> bool:
+        """Check if the blob is loaded or in the blob cache"""
+        if self._blob is not None:
+            return True
+
+        cache = get_blob_cache()
+        checksum = self._blob_checksum() if cache is not None else None
+
+        return checksum is not None and cache.contains(self.uuid, checksum)
+
+    def _get_blob_content(self) -> bytes:
+        """Get blob contents, through the blob cache if enabled"""
+        cache = get_blob_cache()
+        checksum = self._blob_checksum() if cache is not None else None
+
+        if checksum is not None:
+            content = cache.get(self.uuid, checksum)
+
+            if content is not None:
+                return content
+
+        res = self._sumo.get(f"/objects('{self.uuid}')/blob")
+
+        if checksum is not None:
+            cache.put(self.uuid, checksum, res.content)
+
+        return res.content
+
+    async def _get_blob_content_async(self) -> bytes:
+        """Get blob contents, through the blob cache if enabled
+
+        Objects of the same client getting the same blob concurrently
+        share one request.
+        """
+        key = ("blob", _client_scope(self._sumo), self.uuid)
+        return await single_flight(key, self._fetch_blob_content_async)
+
+    async def _fetch_blob_content_async(self) -> bytes:
+        cache = get_blob_cache()
+        checksum = self._blob_checksum() if cache is not None else None
+
+        if checksum is not None:
+            content = cache.get(self.uuid, checksum)
+
+            if content is not None:
+                return content
+
+        res = await self._sumo.get_async(f"/objects('{self.uuid}')/blob")
+
+        if checksum is not None:
+            cache.put(self.uuid, checksum, res.content)
+
+        return res.content
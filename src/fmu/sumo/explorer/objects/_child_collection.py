@@ -1,15 +1,14 @@
 """Module containing class for collection of children"""
 
-from typing import List, Dict, Union
+import asyncio
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Union, Tuple, Callable
 from sumo.wrapper import SumoClient
 from fmu.sumo.explorer.objects._document_collection import DocumentCollection
 from fmu.sumo.explorer.timefilter import TimeFilter
 from fmu.sumo.explorer.pit import Pit
-
-_CHILD_FIELDS = {
-    "include": [],
-    "exclude": ["data.spec.columns", "fmu.realization.parameters"],
-}
+from fmu.sumo.explorer._query import Query
+from fmu.sumo.explorer.objects._child import Child, _CHILD_FIELDS
 
 
 class ChildCollection(DocumentCollection):
@@ -128,7 +127,86 @@ class ChildCollection(DocumentCollection):
         """List of unique contents"""
         return self._get_field_values_async("data.content.keyword")
 
-    def _init_query(self, doc_type: str, query: Dict = None) -> Dict:
+    def download_blobs(
+        self, concurrency: int = 8, callback: Callable = None
+    ) -> Tuple[List[Child], Dict[str, Exception]]:
+        """Download the blobs of all objects in the collection
+
+        Blobs are fetched by a pool of at most `concurrency` workers and
+        kept on the returned objects, so reading their `blob` (or
+        converting them) afterwards does not download anything.
+
+        Args:
+            concurrency (int): max number of concurrent downloads
+            callback (Callable): called as `callback(obj, error)` as each
+                download finishes, `error` being None on success
+
+        Returns:
+            Tuple[List[Child], Dict[str, Exception]]: the objects, and
+            the errors of failed downloads by object uuid
+        """
+        objects = [obj for obj in self]
+        errors = {}
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                executor.submit(lambda obj: obj.blob, obj): obj
+                for obj in objects
+            }
+
+            for future in as_completed(futures):
+                obj = futures[future]
+                error = future.exception()
+
+                if error is not None:
+                    errors[obj.uuid] = error
+
+                if callback is not None:
+                    callback(obj, error)
+
+        return objects, errors
+
+    async def download_blobs_async(
+        self, concurrency: int = 8, callback: Callable = None
+    ) -> Tuple[List[Child], Dict[str, Exception]]:
+        """Download the blobs of all objects in the collection.
+        Async equivalent to 'collection.download_blobs()'
+
+        Args:
+            concurrency (int): max number of concurrent downloads
+            callback (Callable): called as `callback(obj, error)` as each
+                download finishes, `error` being None on success
+
+        Returns:
+            Tuple[List[Child], Dict[str, Exception]]: the objects, and
+            the errors of failed downloads by object uuid
+        """
+        objects = [obj async for obj in self]
+        errors = {}
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def download(obj):
+            error = None
+
+            async with semaphore:
+                try:
+                    await obj.blob_async
+                except Exception as ex:
+                    error = ex
+
+            if error is not None:
+                errors[obj.uuid] = error
+
+            if callback is not None:
+                callback(obj, error)
+
+        await asyncio.gather(*[download(obj) for obj in objects])
+
+        return objects, errors
+
+    def _init_query(
+        self, doc_type: str, query: Union[Dict, Query] = None
+    ) -> Query:
         new_query = super()._init_query(doc_type, query)
         case_filter = {
             "bool": {
@@ -138,7 +216,7 @@ class ChildCollection(DocumentCollection):
             }
         }
 
-        return self._utils.extend_query_object(new_query, case_filter)
+        return new_query.extend(case_filter)
 
     def _add_filter(
         self,
@@ -1,25 +1,95 @@
 """Module containing class for collection of documents"""
-from typing import List, Dict
+import asyncio
+import copy
+import json
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Iterator, AsyncIterator, Tuple, Union
 from sumo.wrapper import SumoClient
 from fmu.sumo.explorer._utils import Utils
+from fmu.sumo.explorer._query import Query
 from fmu.sumo.explorer.pit import Pit
 
+# Size of the windows fetched for random access
+_PAGE_SIZE = 500
+
+# Pages grow from a small first page, for a quick first result, up to the
+# max page size, as long as a page of hits stays within the byte budget
+_FIRST_PAGE_SIZE = 100
+_MAX_PAGE_SIZE = 10000
+_PAGE_BYTES = 8 * 1024**2
+
+# Default index.max_result_window, the furthest `from` + `size` can reach
+_MAX_RESULT_WINDOW = 10000
+
+
+def _field_key(
+    field: str, query: Dict = None, key_as_string: bool = False
+) -> Tuple:
+    """Key of the unique values of a field, among those of the collection
+    matching `query`, as bucket keys or as key strings
+    """
+    query_key = None if query is None else json.dumps(query, sort_keys=True)
+    return (field, query_key, key_as_string)
+
+
+# The read-ahead fetches hold the collection weakly, so that dropping a
+# collection with pages in flight cancels the pages not fetched yet
+
+
+def _fetch_batch(ref: weakref.ref, size: int) -> List[Dict]:
+    collection = ref()
+
+    if collection is None:
+        return []
+
+    return collection._fetch_batch(size)
+
+
+async def _fetch_batch_after(
+    ref: weakref.ref, previous: asyncio.Task, size: int
+) -> List[Dict]:
+    """Fetch a batch of documents once the previous fetch is done
+
+    Arguments:
+        - ref (weakref.ref): reference to the collection
+        - previous (asyncio.Task): fetch of the preceding page
+        - size (int): number of documents to fetch
+
+    Returns:
+        The fetched batch of documents
+    """
+    if previous is not None:
+        await previous
+
+    collection = ref()
+
+    if collection is None:
+        return []
+
+    return await collection._fetch_batch_async(size)
+
 
 class DocumentCollection:
     """Class for representing a collection of documents in Sumo"""
 
+    # Max number of documents per page, lower for documents which each
+    # page needs extra work for
+    _max_page_size = _MAX_PAGE_SIZE
+
     def __init__(
         self,
         doc_type: str,
         sumo: SumoClient,
-        query: Dict = None,
+        query: Union[Dict, Query] = None,
         select: List[str] = None,
         pit: Pit = None,
     ):
         self._utils = Utils(sumo)
         self._type = doc_type
         self._sumo = sumo
-        self._query = self._init_query(doc_type, query)
+        self._query_node = self._init_query(doc_type, query)
 
         self._pit = pit
         self._new_pit_id = None
@@ -29,13 +99,35 @@ class DocumentCollection:
         self._items = []
         self._field_values = {}
         self._select = select
+        self._fields = None
+        self._prefetch = 0
+        self._init_read_ahead()
+        self._window_start = 0
+        self._window = []
+        self._page_size = None
+        self._last_page_size = None
+        self._hit_bytes = None
+
+    def __del__(self):
+        # Pages read ahead for an abandoned collection are not needed
+        if hasattr(self, "_pending_tasks"):
+            self._cancel_read_ahead()
+
+    @property
+    def _query(self) -> Dict:
+        """Query object of the collection, built when first needed"""
+        return self._query_node.to_dict()
+
+    @_query.setter
+    def _query(self, query: Dict) -> None:
+        self._query_node = Query(query)
 
     def __iter__(self):
         self._curr_index = 0
         return self
 
     def __next__(self):
-        if self._curr_index < self.__len__():
+        if self._curr_index < self._load_size():
             res = self.__getitem__(self._curr_index)
             self._curr_index += 1
             return res
@@ -47,7 +139,7 @@ class DocumentCollection:
         return self
 
     async def __anext__(self):
-        if self._curr_index < await self.length_async():
+        if self._curr_index < await self._load_size_async():
             res = await self.getitem_async(self._curr_index)
             self._curr_index += 1
             return res
@@ -57,11 +149,16 @@ class DocumentCollection:
     def __len__(self) -> int:
         """Get size of document collection
 
+        The size is counted without fetching any documents. Beware that
+        `list(collection)` asks for the length as a size hint, which
+        costs a count request on top of the pages; iterate with a
+        comprehension instead.
+
         Returns:
             Document collection size
         """
         if self._len is None:
-            self._next_batch()
+            self._len = self._count()
 
         return self._len
 
@@ -71,50 +168,263 @@ class DocumentCollection:
         Returns:
             Document collection size
         """
+        if self._len is None:
+            self._len = await self._count_async()
+
+        return self._len
+
+    def _load_size(self) -> int:
+        """Get collection size, fetching the first page if needed
+
+        Used before reading documents, since the first page gives the size
+        along with the first documents.
+        """
+        if self._len is None:
+            self._next_batch()
+
+        return self._len
+
+    async def _load_size_async(self) -> int:
+        """Get collection size, fetching the first page if needed"""
         if self._len is None:
             await self._next_batch_async()
 
         return self._len
 
-    def __getitem__(self, index: int) -> Dict:
-        """Get document
+    def _count(self) -> int:
+        """Count the documents in the collection, without fetching any"""
+        self._resolve_query()
+        res = self._utils.search(self._make_count_query())
+
+        if self._pit is not None:
+            self._new_pit_id = res["pit_id"]
+
+        return res["hits"]["total"]["value"]
+
+    async def _count_async(self) -> int:
+        """Count the documents in the collection, without fetching any"""
+        await self._resolve_query_async()
+        res = await self._utils.search_async(self._make_count_query())
+
+        if self._pit is not None:
+            self._new_pit_id = res["pit_id"]
+
+        return res["hits"]["total"]["value"]
+
+    def _make_count_query(self) -> Dict:
+        query = {
+            "query": self._query,
+            "size": 0,
+            "track_total_hits": True,
+        }
+
+        if self._pit is not None:
+            query["pit"] = self._pit.get_pit_object(self._new_pit_id)
+
+        return query
+
+    def __getitem__(self, index: Union[int, slice]):
+        """Get document, or list of documents for a slice
+
+        Documents far beyond those already paged through are fetched as a
+        window with `from`/`size`, without fetching the documents before
+        them. Only the most recent window is kept.
 
         Arguments:
-            - index (int): index
+            - index (int or slice): index, or slice of indexes
 
         Returns:
-            A document at a given index
+            A document at a given index, or a List of documents
         """
-        if index > self.__len__():
+        if isinstance(index, slice):
+            return self._get_slice(index)
+
+        size = self._load_size()
+
+        if index < 0:
+            index += size
+
+        if not 0 <= index < size:
             raise IndexError
 
+        if index < len(self._items):
+            return self._to_object(self._items[index])
+
+        if not self._in_window(index) and self._use_window(index):
+            start = index - index % _PAGE_SIZE
+            count = min(_PAGE_SIZE, _MAX_RESULT_WINDOW - start)
+            self._window = self._fetch_window(start, count)
+            self._window_start = start
+
+        if self._in_window(index):
+            return self._to_object(self._window[index - self._window_start])
+
         while len(self._items) <= index:
             hits_size = self._next_batch()
 
             if hits_size == 0:
                 raise IndexError
 
-        return self._items[index]
+        return self._to_object(self._items[index])
 
-    async def getitem_async(self, index: int) -> Dict:
+    async def getitem_async(self, index: Union[int, slice]):
         """Get document. Async equivalent to 'collection[index]'
 
         Arguments:
-            - index (int): index
+            - index (int or slice): index, or slice of indexes
 
         Returns:
-            A document at a given index
+            A document at a given index, or a List of documents
         """
-        if index > await self.length_async():
+        if isinstance(index, slice):
+            return await self._get_slice_async(index)
+
+        size = await self._load_size_async()
+
+        if index < 0:
+            index += size
+
+        if not 0 <= index < size:
             raise IndexError
 
+        if index < len(self._items):
+            return self._to_object(self._items[index])
+
+        if not self._in_window(index) and self._use_window(index):
+            start = index - index % _PAGE_SIZE
+            count = min(_PAGE_SIZE, _MAX_RESULT_WINDOW - start)
+            self._window = await self._fetch_window_async(start, count)
+            self._window_start = start
+
+        if self._in_window(index):
+            return self._to_object(self._window[index - self._window_start])
+
         while len(self._items) <= index:
             hits_size = await self._next_batch_async()
 
             if hits_size == 0:
                 raise IndexError
 
-        return self._items[index]
+        return self._to_object(self._items[index])
+
+    def _in_window(self, index: int) -> bool:
+        return 0 <= index - self._window_start < len(self._window)
+
+    def _use_window(self, index: int) -> bool:
+        """Check if a document is better fetched as a window than by paging
+
+        Documents in the next page are paged to, and `from`/`size` cannot
+        reach beyond the max result window of the index.
+        """
+        return len(self._items) + _PAGE_SIZE <= index < _MAX_RESULT_WINDOW
+
+    def _get_slice(self, index: slice) -> List:
+        positions = range(*index.indices(len(self)))
+
+        if len(positions) == 0:
+            return []
+
+        start, stop = min(positions), max(positions) + 1
+
+        if stop <= len(self._items):
+            hits = self._items[start:stop]
+        elif stop <= _MAX_RESULT_WINDOW:
+            hits = []
+            for offset in range(start, stop, self._max_page_size):
+                size = min(self._max_page_size, stop - offset)
+                hits.extend(self._fetch_window(offset, size))
+        else:
+            hits = []
+            offset = 0
+            self._resolve_query()
+
+            for page in self._pages():
+                hits.extend(page[max(start - offset, 0) : stop - offset])
+                offset += len(page)
+
+                if offset >= stop:
+                    break
+
+        return [self._to_object(hits[i - start]) for i in positions]
+
+    async def _get_slice_async(self, index: slice) -> List:
+        positions = range(*index.indices(await self.length_async()))
+
+        if len(positions) == 0:
+            return []
+
+        start, stop = min(positions), max(positions) + 1
+
+        if stop <= len(self._items):
+            hits = self._items[start:stop]
+        elif stop <= _MAX_RESULT_WINDOW:
+            hits = []
+            for offset in range(start, stop, self._max_page_size):
+                size = min(self._max_page_size, stop - offset)
+                hits.extend(await self._fetch_window_async(offset, size))
+        else:
+            hits = []
+            offset = 0
+            await self._resolve_query_async()
+
+            async for page in self._pages_async():
+                hits.extend(page[max(start - offset, 0) : stop - offset])
+                offset += len(page)
+
+                if offset >= stop:
+                    break
+
+        return [self._to_object(hits[i - start]) for i in positions]
+
+    def _fetch_window(self, start: int, size: int) -> List[Dict]:
+        """Fetch documents by position, independently of the paging state
+
+        Arguments:
+            - start (int): position of the first document
+            - size (int): number of documents
+
+        Returns:
+            The fetched documents
+        """
+        self._resolve_query()
+        query, pit = self._make_batch_query(None, self._new_pit_id)
+        query["from"] = start
+        query["size"] = size
+
+        res = self._utils.search(query)
+        hits = res["hits"]["hits"]
+
+        self._postprocess_batch(hits, pit)
+
+        if self._pit is not None:
+            self._new_pit_id = res["pit_id"]
+
+        return hits
+
+    async def _fetch_window_async(self, start: int, size: int) -> List[Dict]:
+        """Fetch documents by position, independently of the paging state
+
+        Arguments:
+            - start (int): position of the first document
+            - size (int): number of documents
+
+        Returns:
+            The fetched documents
+        """
+        await self._resolve_query_async()
+        query, pit = self._make_batch_query(None, self._new_pit_id)
+        query["from"] = start
+        query["size"] = size
+
+        data = await self._utils.search_async(query)
+        hits = data["hits"]["hits"]
+
+        await self._postprocess_batch_async(hits, pit)
+
+        if self._pit is not None:
+            self._new_pit_id = data["pit_id"]
+
+        return hits
 
     def _get_field_values(
         self, field: str, query: Dict = None, key_as_string: bool = False
@@ -127,15 +437,17 @@ class DocumentCollection:
         Returns:
             A List of unique values for the given field
         """
-        if field not in self._field_values:
+        values_key = _field_key(field, query, key_as_string)
+
+        if values_key not in self._field_values:
             bucket_query = self._utils.extend_query_object(self._query, query)
             key = "key_as_string" if key_as_string is True else "key"
             buckets = self._utils.get_buckets(field, bucket_query)
-            self._field_values[field] = list(
+            self._field_values[values_key] = list(
                 map(lambda bucket: bucket[key], buckets)
             )
 
-        return self._field_values[field]
+        return self._field_values[values_key]
 
     async def _get_field_values_async(
         self, field: str, query: Dict = None, key_as_string: bool = False
@@ -148,15 +460,236 @@ class DocumentCollection:
         Returns:
             A List of unique values for the given field
         """
-        if field not in self._field_values:
+        values_key = _field_key(field, query, key_as_string)
+
+        if values_key not in self._field_values:
             bucket_query = self._utils.extend_query_object(self._query, query)
             key = "key_as_string" if key_as_string is True else "key"
             buckets = await self._utils.get_buckets_async(field, bucket_query)
-            self._field_values[field] = list(
+            self._field_values[values_key] = list(
                 map(lambda bucket: bucket[key], buckets)
             )
 
-        return self._field_values[field]
+        return self._field_values[values_key]
+
+    def facets(self, fields: List[str]) -> Dict[str, List]:
+        """Get Lists of unique values for several fields at once
+
+        The values of all fields not already known are fetched in one
+        request, and are reused by properties such as `names`.
+
+        Arguments:
+            - fields (List[str]): metadata fields
+
+        Returns:
+            A List of unique values by field
+
+        Examples:
+
+            Populate filter options::
+
+                facets = surfs.facets(
+                    ["data.name.keyword", "fmu.realization.id"]
+                )
+        """
+        missing = [
+            field
+            for field in fields
+            if _field_key(field) not in self._field_values
+        ]
+
+        if len(missing) > 0:
+            facets = self._utils.get_facets(missing, self._query)
+            self._set_facets(facets)
+
+        return {
+            field: self._field_values[_field_key(field)] for field in fields
+        }
+
+    async def facets_async(self, fields: List[str]) -> Dict[str, List]:
+        """Get Lists of unique values for several fields at once
+
+        Arguments:
+            - fields (List[str]): metadata fields
+
+        Returns:
+            A List of unique values by field
+        """
+        missing = [
+            field
+            for field in fields
+            if _field_key(field) not in self._field_values
+        ]
+
+        if len(missing) > 0:
+            facets = await self._utils.get_facets_async(missing, self._query)
+            self._set_facets(facets)
+
+        return {
+            field: self._field_values[_field_key(field)] for field in fields
+        }
+
+    def _set_facets(self, facets: Dict[str, List[Dict]]) -> None:
+        for field, buckets in facets.items():
+            values = [bucket["key"] for bucket in buckets]
+            self._field_values[_field_key(field)] = values
+
+    def select(self, fields: List[str]) -> "DocumentCollection":
+        """Limit the metadata fetched for each document in the collection
+
+        Objects from a child collection fetch their full metadata the
+        first time a property that was not selected is read. The
+        selection is kept by collections filtered from the new one.
+
+        Arguments:
+            - fields (List[str]): dotted paths of metadata fields to fetch
+
+        Returns:
+            A new collection of the same documents
+        """
+        collection = copy.copy(self)
+        # The pages read ahead belong to this collection, not to the copy
+        collection._init_read_ahead()
+        collection._select = fields
+        collection._fields = fields
+        collection._reset_paging()
+
+        return collection
+
+    def _reset_paging(self) -> None:
+        """Forget the documents paged through, and any read-ahead"""
+        self._items = []
+        self._window_start = 0
+        self._window = []
+        self._after = None
+        self._new_pit_id = None
+        self._curr_index = 0
+        self._last_page_size = None
+        self._hit_bytes = None
+        self._cancel_read_ahead()
+        self._field_values = dict(self._field_values)
+
+    def _init_read_ahead(self) -> None:
+        self._requested = 0
+        self._executor = None
+        self._pending = deque()
+        self._pending_tasks = deque()
+
+    def _cancel_read_ahead(self) -> None:
+        """Cancel the pages requested ahead, and stop the read-ahead worker"""
+        for future in self._pending:
+            future.cancel()
+
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+
+        for task in self._pending_tasks:
+            if not task.done() and not task.get_loop().is_closed():
+                task.cancel()
+
+        self._init_read_ahead()
+
+    def _derive(self, collection: "DocumentCollection"):
+        """Carry the selection, the page size and the read-ahead over to a
+        collection filtered from this one
+
+        Arguments:
+            - collection (DocumentCollection): the filtered collection
+
+        Returns:
+            The filtered collection
+        """
+        collection._select = self._select
+        collection._fields = self._fields
+        collection._page_size = self._page_size
+        collection._prefetch = self._prefetch
+
+        return collection
+
+    def page_size(self, size: int = None) -> "DocumentCollection":
+        """Set the number of documents fetched per page
+
+        By default, the first page is small, so that the first documents
+        arrive quickly, and pages then double in size as the collection
+        is paged through, up to 10000 documents (1000 for cases), or
+        fewer when the documents are large.
+
+        Arguments:
+            - size (int): number of documents per page, adaptive if None
+
+        Returns:
+            The collection itself, to allow chaining
+        """
+        if size is not None and not 0 < size <= self._max_page_size:
+            raise ValueError(
+                f"Page size must be between 1 and {self._max_page_size}"
+            )
+
+        self._page_size = size
+        return self
+
+    def _first_page_size(self) -> int:
+        if self._page_size is not None:
+            return self._page_size
+
+        return _FIRST_PAGE_SIZE
+
+    def _grow_page_size(self, size: int) -> int:
+        """Get the size of the page following a page of a given size
+
+        Arguments:
+            - size (int): size of the previous page
+
+        Returns:
+            The size of the next page
+        """
+        if self._page_size is not None:
+            return self._page_size
+
+        size = min(size * 2, self._max_page_size)
+
+        if self._hit_bytes is not None:
+            size = min(size, max(_PAGE_BYTES // self._hit_bytes, 1))
+
+        return size
+
+    def _next_page_size(self) -> int:
+        """Get the size of the next page of the collection"""
+        if self._last_page_size is None:
+            size = self._first_page_size()
+        else:
+            size = self._grow_page_size(self._last_page_size)
+
+        self._last_page_size = size
+        return size
+
+    def _measure_hits(self, hits: List[Dict]) -> None:
+        """Estimate the size of hits from the first, middle and last one"""
+        if len(hits) == 0:
+            return
+
+        sample = [hits[0], hits[len(hits) // 2], hits[-1]]
+        size = sum(len(json.dumps(hit)) for hit in sample) // len(sample)
+        self._hit_bytes = max(size, 1)
+
+    def prefetch(self, pages: int = 2) -> "DocumentCollection":
+        """Read ahead while iterating the collection
+
+        When enabled, the next pages of documents are requested in the
+        background while the current page is being consumed; on a worker
+        thread for sync iteration and on asyncio tasks for async
+        iteration. Pages are still fetched one after the other, since
+        each page continues from the last hit of the previous one. Pages
+        not yet fetched are cancelled when the collection is dropped.
+
+        Arguments:
+            - pages (int): max number of pages in flight, 0 disables
+
+        Returns:
+            The collection itself, to allow chaining
+        """
+        self._prefetch = pages
+        return self
 
     def _next_batch(self) -> List[Dict]:
         """Get next batch of documents
@@ -164,30 +697,115 @@ class DocumentCollection:
         Returns:
             The next batch of documents
         """
-        query = {
-            "query": self._query,
-            "sort": [{"_doc": {"order": "desc"}}],
-            "size": 500,
-        }
+        self._resolve_query()
 
-        if self._select:
-            query["_source"] = self._select
+        if self._prefetch > 0 and self._len is not None:
+            hits = self._next_prefetched_batch()
+        else:
+            hits = self._fetch_batch()
 
-        if self._len is None:
-            query["track_total_hits"] = True
+        self._items.extend(hits)
 
-        if self._after is not None:
-            query["search_after"] = self._after
+        return len(hits)
 
-        pit = None
-        if self._pit is not None:
-            pit = self._pit.get_pit_object(self._new_pit_id)
-            query["pit"] = pit
+    async def _next_batch_async(self) -> List[Dict]:
+        """Get next batch of documents
+
+        Returns:
+            The next batch of documents
+        """
+        await self._resolve_query_async()
+
+        if self._prefetch > 0 and self._len is not None:
+            hits = await self._next_prefetched_batch_async()
+        else:
+            hits = await self._fetch_batch_async()
+
+        self._items.extend(hits)
+
+        return len(hits)
+
+    def _next_prefetched_batch(self) -> List[Dict]:
+        """Get next batch of documents from the read-ahead queue
+
+        Returns:
+            The next batch of documents
+        """
+        if self._executor is None:
+            # A single worker runs the fetches in submission order, so
+            # every page picks up the search_after of the one before it
+            self._executor = ThreadPoolExecutor(max_workers=1)
+            self._requested = len(self._items)
+
+        while (
+            len(self._pending) < self._prefetch
+            and self._requested < self._len
+        ):
+            size = self._next_page_size()
+            future = self._executor.submit(
+                _fetch_batch, weakref.ref(self), size
+            )
+            self._pending.append(future)
+            self._requested += size
+
+        if len(self._pending) == 0:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+            return []
+
+        return self._pending.popleft().result()
+
+    async def _next_prefetched_batch_async(self) -> List[Dict]:
+        """Get next batch of documents from the read-ahead queue
+
+        Returns:
+            The next batch of documents
+        """
+        if len(self._pending_tasks) == 0:
+            self._requested = len(self._items)
+
+        while (
+            len(self._pending_tasks) < self._prefetch
+            and self._requested < self._len
+        ):
+            previous = self._pending_tasks[-1] if self._pending_tasks else None
+            size = self._next_page_size()
+            task = asyncio.ensure_future(
+                _fetch_batch_after(weakref.ref(self), previous, size)
+            )
+            self._pending_tasks.append(task)
+            self._requested += size
+
+        if len(self._pending_tasks) == 0:
+            return []
+
+        return await self._pending_tasks.popleft()
+
+    def _fetch_batch(self, size: int = None) -> List[Dict]:
+        """Fetch the page of documents following the last fetched one
+
+        Arguments:
+            - size (int): number of documents to fetch, the next page size
+              if None
+
+        Returns:
+            The fetched batch of documents
+        """
+        if size is None:
+            size = self._next_page_size()
 
-        res = self._sumo.post("/search", json=query).json()
+        query, pit = self._make_batch_query(
+            self._after, self._new_pit_id, size
+        )
+
+        if self._len is None:
+            query["track_total_hits"] = True
+
+        res = self._utils.search(query)
         hits = res["hits"]
 
         self._postprocess_batch(hits["hits"], pit)
+        self._measure_hits(hits["hits"])
 
         if self._pit is not None:
             self._new_pit_id = res["pit_id"]
@@ -197,41 +815,34 @@ class DocumentCollection:
 
         if len(hits["hits"]) > 0:
             self._after = hits["hits"][-1]["sort"]
-            self._items.extend(hits["hits"])
 
-        return len(hits["hits"])
+        return hits["hits"]
 
-    async def _next_batch_async(self) -> List[Dict]:
-        """Get next batch of documents
+    async def _fetch_batch_async(self, size: int = None) -> List[Dict]:
+        """Fetch the page of documents following the last fetched one
+
+        Arguments:
+            - size (int): number of documents to fetch, the next page size
+              if None
 
         Returns:
-            The next batch of documents
+            The fetched batch of documents
         """
-        query = {
-            "query": self._query,
-            "sort": [{"_doc": {"order": "desc"}}],
-            "size": 500,
-        }
+        if size is None:
+            size = self._next_page_size()
 
-        if self._select:
-            query["_source"] = self._select
+        query, pit = self._make_batch_query(
+            self._after, self._new_pit_id, size
+        )
 
         if self._len is None:
             query["track_total_hits"] = True
 
-        if self._after is not None:
-            query["search_after"] = self._after
-
-        pit = None
-        if self._pit is not None:
-            pit = self._pit.get_pit_object(self._new_pit_id)
-            query["pit"] = pit
-
-        res = await self._sumo.post_async("/search", json=query)
-        data = res.json()
+        data = await self._utils.search_async(query)
         hits = data["hits"]
 
         await self._postprocess_batch_async(hits["hits"], pit)
+        self._measure_hits(hits["hits"])
 
         if self._pit is not None:
             self._new_pit_id = data["pit_id"]
@@ -241,9 +852,249 @@ class DocumentCollection:
 
         if len(hits["hits"]) > 0:
             self._after = hits["hits"][-1]["sort"]
-            self._items.extend(hits["hits"])
 
-        return len(hits["hits"])
+        return hits["hits"]
+
+    def _make_batch_query(
+        self, after: List = None, pit_id: str = None, size: int = _PAGE_SIZE
+    ):
+        """Make query for a page of documents
+
+        Arguments:
+            - after (List): sort values of the last hit of previous page
+            - pit_id (str): most recent point in time id
+            - size (int): number of documents in the page
+
+        Returns:
+            The query and the point in time object it uses, if any
+        """
+        query = {
+            "query": self._query,
+            "sort": [{"_doc": {"order": "desc"}}],
+            "size": size,
+        }
+
+        if self._select:
+            query["_source"] = self._select
+
+        if after is not None:
+            query["search_after"] = after
+
+        pit = None
+        if self._pit is not None:
+            pit = self._pit.get_pit_object(pit_id)
+            query["pit"] = pit
+
+        return query, pit
+
+    def scan(self, slices: int = 4) -> List:
+        """Get every document in the collection with a sliced scroll
+
+        When the collection has a point in time, the result set is split
+        into `slices` disjoint slices which are paged through in parallel
+        and merged into one list. Without a point in time, the collection
+        is paged through sequentially.
+
+        Arguments:
+            - slices (int): number of slices to fetch concurrently
+
+        Returns:
+            A List of all documents in the collection
+        """
+        self._resolve_query()
+
+        if self._pit is None or slices < 2:
+            return [item for item in self]
+
+        with ThreadPoolExecutor(max_workers=slices) as executor:
+            pages = executor.map(
+                lambda slice_id: self._scan_slice(slice_id, slices),
+                range(slices),
+            )
+            hits = [hit for page in pages for hit in page]
+
+        return [self._to_object(hit) for hit in hits]
+
+    async def scan_async(self, slices: int = 4) -> List:
+        """Get every document in the collection with a sliced scroll.
+        Async equivalent to 'collection.scan()'
+
+        Arguments:
+            - slices (int): number of slices to fetch concurrently
+
+        Returns:
+            A List of all documents in the collection
+        """
+        await self._resolve_query_async()
+
+        if self._pit is None or slices < 2:
+            return [item async for item in self]
+
+        pages = await asyncio.gather(
+            *[
+                self._scan_slice_async(slice_id, slices)
+                for slice_id in range(slices)
+            ]
+        )
+        hits = [hit for page in pages for hit in page]
+
+        return [self._to_object(hit) for hit in hits]
+
+    def _scan_slice(self, slice_id: int, slices: int) -> List[Dict]:
+        """Page through one slice of the point in time
+
+        Arguments:
+            - slice_id (int): slice to page through
+            - slices (int): total number of slices
+
+        Returns:
+            All documents in the slice
+        """
+        return [hit for page in self._pages(slice_id, slices) for hit in page]
+
+    async def _scan_slice_async(
+        self, slice_id: int, slices: int
+    ) -> List[Dict]:
+        """Page through one slice of the point in time
+
+        Arguments:
+            - slice_id (int): slice to page through
+            - slices (int): total number of slices
+
+        Returns:
+            All documents in the slice
+        """
+        hits = []
+
+        async for page in self._pages_async(slice_id, slices):
+            hits.extend(page)
+
+        return hits
+
+    def stream(self) -> Iterator:
+        """Iterate over the collection without retaining documents
+
+        Unlike iterating the collection itself, which keeps every
+        document it has paged through, only the current page of
+        documents is held in memory. Paging uses `search_after`, and the
+        point in time of the collection if it has one.
+
+        Yields:
+            The objects of the collection, one at a time
+        """
+        self._resolve_query()
+
+        for page in self._pages():
+            for hit in page:
+                yield self._to_object(hit)
+
+    async def stream_async(self) -> AsyncIterator:
+        """Iterate over the collection without retaining documents.
+        Async equivalent to 'collection.stream()'
+
+        Yields:
+            The objects of the collection, one at a time
+        """
+        await self._resolve_query_async()
+
+        async for page in self._pages_async():
+            for hit in page:
+                yield self._to_object(hit)
+
+    def _pages(self, slice_id: int = None, slices: int = None) -> Iterator:
+        """Page through the collection independently of its paging state
+
+        Arguments:
+            - slice_id (int): slice to page through, if any
+            - slices (int): total number of slices
+
+        Yields:
+            One page of documents at a time
+        """
+        after = None
+        pit_id = None
+        size = self._first_page_size()
+
+        while True:
+            query, pit = self._make_batch_query(after, pit_id, size)
+
+            if slice_id is not None:
+                query["slice"] = {"id": slice_id, "max": slices}
+
+            res = self._utils.search(query)
+            page = res["hits"]["hits"]
+
+            self._postprocess_batch(page, pit)
+            self._measure_hits(page)
+
+            if self._pit is not None:
+                pit_id = res["pit_id"]
+
+            yield page
+
+            if len(page) < size:
+                return
+
+            after = page[-1]["sort"]
+            size = self._grow_page_size(size)
+
+    async def _pages_async(
+        self, slice_id: int = None, slices: int = None
+    ) -> AsyncIterator:
+        """Page through the collection independently of its paging state
+
+        Arguments:
+            - slice_id (int): slice to page through, if any
+            - slices (int): total number of slices
+
+        Yields:
+            One page of documents at a time
+        """
+        after = None
+        pit_id = None
+        size = self._first_page_size()
+
+        while True:
+            query, pit = self._make_batch_query(after, pit_id, size)
+
+            if slice_id is not None:
+                query["slice"] = {"id": slice_id, "max": slices}
+
+            data = await self._utils.search_async(query)
+            page = data["hits"]["hits"]
+
+            await self._postprocess_batch_async(page, pit)
+            self._measure_hits(page)
+
+            if self._pit is not None:
+                pit_id = data["pit_id"]
+
+            yield page
+
+            if len(page) < size:
+                return
+
+            after = page[-1]["sort"]
+            size = self._grow_page_size(size)
+
+    def _to_object(self, doc: Dict):
+        """Wrap a search hit in the object type of the collection
+
+        Arguments:
+            - doc (Dict): search hit
+
+        Returns:
+            The object representing the hit
+        """
+        return doc
+
+    def _resolve_query(self):
+        """Finalize the collection query before searching"""
+        return
+
+    async def _resolve_query_async(self):
+        """Finalize the collection query before searching"""
+        return
 
     def _postprocess_batch(self, hits, pit):
         return
@@ -251,7 +1102,9 @@ class DocumentCollection:
     async def _postprocess_batch_async(self, hits, pit):
         return
 
-    def _init_query(self, doc_type: str, query: Dict = None) -> Dict:
+    def _init_query(
+        self, doc_type: str, query: Union[Dict, Query] = None
+    ) -> Query:
         """Initialize base filter for document collection
 
         Arguments:
@@ -265,12 +1118,9 @@ class DocumentCollection:
             "bool": {"must": [{"term": {"class.keyword": doc_type}}]}
         }
 
-        if query is not None:
-            return self._utils.extend_query_object(class_filter, query)
-
-        return class_filter
+        return Query(class_filter).extend(query)
 
-    def _add_filter(self, query: Dict) -> Dict:
+    def _add_filter(self, query: Dict) -> Query:
         """Add filter to DocumentCollection base filter
 
         Argmuments:
@@ -280,4 +1130,4 @@ class DocumentCollection:
             Filter object containing base filters and new filters
         """
 
-        return self._utils.extend_query_object(self._query, query)
+        return self._query_node.extend(query)
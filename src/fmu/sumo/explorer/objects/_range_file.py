@@ -0,0 +1,99 @@
+"""Module containing random access file over HTTP range requests"""
+import io
+import httpx
+
+
+class RangeFile(io.RawIOBase):
+    """Read-only file reading a remote blob with HTTP range requests
+
+    Each read fetches only the requested bytes, so readers that seek,
+    such as `pyarrow.parquet.ParquetFile`, transfer only the parts of the
+    blob they need.
+    """
+
+    def __init__(self, url: str, size: int = None) -> None:
+        """
+        Args:
+            url (str): url of the blob, including any authorization
+            size (int): size of the blob in bytes, looked up if None
+        """
+        super().__init__()
+        self._url = url
+        self._size = size
+        self._pos = 0
+        self._client = httpx.Client(follow_redirects=True)
+
+    def _get_range(self, start: int, end: int) -> httpx.Response:
+        res = self._client.get(
+            self._url, headers={"Range": f"bytes={start}-{end}"}
+        )
+        res.raise_for_status()
+
+        # A server ignoring the range answers 200 with the whole blob
+        content_range = res.headers.get("Content-Range", "")
+
+        if res.status_code != 206 or not content_range.startswith(
+            f"bytes {start}-"
+        ):
+            raise OSError(
+                f"Range request for bytes {start}-{end} was not honoured "
+                f"(status {res.status_code}, "
+                f"Content-Range {content_range!r})"
+            )
+
+        return res
+
+    @property
+    def size(self) -> int:
+        """Size of the blob in bytes"""
+        if self._size is None:
+            # Content-Range is "bytes 0-0/<size>"
+            res = self._get_range(0, 0)
+            self._size = int(res.headers["Content-Range"].split("/")[-1])
+
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self._pos = offset
+        elif whence == io.SEEK_CUR:
+            self._pos += offset
+        elif whence == io.SEEK_END:
+            self._pos = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+
+        return self._pos
+
+    def read(self, size: int = -1) -> bytes:
+        end = self.size if size is None or size < 0 else self._pos + size
+        end = min(end, self.size)
+
+        if end <= self._pos:
+            return b""
+
+        content = self._get_range(self._pos, end - 1).content
+        self._pos += len(content)
+
+        return content
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    def readinto(self, buffer) -> int:
+        content = self.read(len(buffer))
+        buffer[: len(content)] = content
+        return len(content)
+
+    def close(self) -> None:
+        self._client.close()
+        super().close()
@@ -86,8 +86,8 @@ class Case(Document):
                 "size": 0,
             }
 
-            res = self._sumo.post("/search", json=query)
-            buckets = res.json()["aggregations"]["uuid"]["buckets"]
+            res = self._utils.search(query)
+            buckets = res["aggregations"]["uuid"]["buckets"]
             iterations = []
 
             for bucket in buckets:
@@ -131,8 +131,8 @@ class Case(Document):
                 "size": 0,
             }
 
-            res = await self._sumo.post_async("/search", json=query)
-            buckets = res.json()["aggregations"]["id"]["buckets"]
+            res = await self._utils.search_async(query)
+            buckets = res["aggregations"]["id"]["buckets"]
             iterations = []
 
             for bucket in buckets:
@@ -21,7 +21,7 @@ def _make_overview_query(ids, pit):
             "cases": {
                 "terms": {
                     "field": "fmu.case.uuid.keyword",
-                    "size": 1000
+                    "size": max(len(ids), 1)
                 },
                 "aggs": {
                     "iteration_uuids": {
@@ -84,6 +84,10 @@ def _make_overview_query(ids, pit):
 class CaseCollection(DocumentCollection):
     """A class for representing a collection of cases in Sumo"""
 
+    # Each page of cases is followed by an aggregation over the objects of
+    # those cases, which must stay within the bucket limit of the backend
+    _max_page_size = 1000
+
     def __init__(self, sumo: SumoClient, query: Dict = None, pit: Pit = None, has = None):
         """
         Args:
@@ -160,51 +164,34 @@ class CaseCollection(DocumentCollection):
             "masterdata.smda.field.identifier.keyword"
         )
 
-    def __getitem__(self, index: int) -> Case:
-        doc = super().__getitem__(index)
+    def _to_object(self, doc: Dict) -> Case:
         uuid = doc["_id"]
         overview = self._overviews[uuid]
         return Case(self._sumo, doc, overview, self._pit)
 
-    async def getitem_async(self, index: int) -> Case:
-        doc = await super().getitem_async(index)
-        uuid = doc["_id"]
-        overview = self._overviews[uuid]
-        return Case(self._sumo, doc, overview, self._pit)
-
-    def _next_batch(self) -> List[Dict]:
-        """Get next batch of documents
-
-        Returns:
-            The next batch of documents
-        """
+    def _resolve_query(self):
+        """Replace the `has` filter with the ids of the matching cases"""
         if self._has is not None:
             uuids = self.uuids
             query = { "bool": { "must": [ {"terms": { "fmu.case.uuid.keyword": uuids}}, self._has]}}
             nuuids = [ x["key"] for x in self._utils.get_buckets("fmu.case.uuid.keyword", query)]
             self._query = {"ids": {"values": nuuids}}
             self._has = None
-        return super()._next_batch()
-
-    async def _next_batch_async(self) -> List[Dict]:
-        """Get next batch of documents
 
-        Returns:
-            The next batch of documents
-        """
+    async def _resolve_query_async(self):
+        """Replace the `has` filter with the ids of the matching cases"""
         if self._has is not None:
             uuids = await self.uuids_async
             query = { "bool": { "must": [ {"terms": { "fmu.case.uuid.keyword": uuids}}, self._has]}}
-            nuuids = [ x["key"] for x in self._utils.get_buckets("fmu.case.uuid.keyword", query)]
+            buckets = await self._utils.get_buckets_async("fmu.case.uuid.keyword", query)
+            nuuids = [ x["key"] for x in buckets]
             self._query = {"ids": {"values": nuuids}}
             self._has = None
-        return await super()._next_batch_async()
 
     def _postprocess_batch(self, hits, pit):
         ids = [hit["_id"] for hit in hits]
         query = _make_overview_query(ids, pit)
-        res = self._sumo.post("/search", json=query)
-        data = res.json()
+        data = self._utils.search(query)
         aggs = data["aggregations"]
         self._insert_overviews(aggs)
         return
@@ -212,8 +199,7 @@ class CaseCollection(DocumentCollection):
     async def _postprocess_batch_async(self, hits, pit):
         ids = [hit["_id"] for hit in hits]
         query = _make_overview_query(ids, pit)
-        res = await self._sumo.post_async("/search", json=query)
-        data = res.json()
+        data = await self._utils.search_async(query)
         aggs = data["aggregations"]
         self._insert_overviews(aggs)
         return
@@ -283,4 +269,6 @@ class CaseCollection(DocumentCollection):
 
         query = super()._add_filter({"bool": {"must": must}})
 
-        return CaseCollection(self._sumo, query, self._pit, has = has)
+        return self._derive(
+            CaseCollection(self._sumo, query, self._pit, has = has)
+        )
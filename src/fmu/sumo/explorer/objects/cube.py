@@ -1,6 +1,6 @@
 """Module containing class for cube object"""
 import json
-from typing import Dict
+from typing import Dict, List
 from sumo.wrapper import SumoClient
 from fmu.sumo.explorer.objects._child import Child
 import sys
@@ -15,13 +15,16 @@ except ImportError:
 class Cube(Child):
     """Class representig a seismic cube object in Sumo"""
 
-    def __init__(self, sumo: SumoClient, metadata: Dict) -> None:
+    def __init__(
+        self, sumo: SumoClient, metadata: Dict, select: List[str] = None
+    ) -> None:
         """
         Args:
             sumo (SumoClient): connection to Sumo
             metadata (dict): cube metadata
+            select (List[str]): metadata fields fetched, if not all
         """
-        super().__init__(sumo, metadata)
+        super().__init__(sumo, metadata, select)
         self._url = None
         self._sas = None
 
@@ -33,13 +33,8 @@ class CubeCollection(ChildCollection):
         """
         super().__init__("cube", sumo, case_uuid, query, pit)
 
-    def __getitem__(self, index) -> Cube:
-        doc = super().__getitem__(index)
-        return Cube(self._sumo, doc)
-
-    async def getitem_async(self, index: int) -> Cube:
-        doc = await super().getitem_async(index)
-        return Cube(self._sumo, doc)
+    def _to_object(self, doc: Dict) -> Cube:
+        return Cube(self._sumo, doc, self._fields)
 
     @property
     def timestamps(self) -> List[str]:
@@ -58,9 +53,8 @@ class CubeCollection(ChildCollection):
     @property
     def intervals(self) -> List[Tuple]:
         """List of unique intervals in CubeCollection"""
-        res = self._sumo.post(
-            "/search",
-            json={
+        res = self._utils.search(
+            {
                 "query": self._query,
                 "aggs": {
                     "t0": {
@@ -78,7 +72,7 @@ class CubeCollection(ChildCollection):
             },
         )
 
-        buckets = res.json()["aggregations"]["t0"]["buckets"]
+        buckets = res["aggregations"]["t0"]["buckets"]
         intervals = []
 
         for bucket in buckets:
@@ -92,9 +86,8 @@ class CubeCollection(ChildCollection):
     @property
     async def intervals_async(self) -> List[Tuple]:
         """List of unique intervals in CubeCollection"""
-        res = await self._sumo.post_async(
-            "/search",
-            json={
+        res = await self._utils.search_async(
+            {
                 "query": self._query,
                 "aggs": {
                     "t0": {
@@ -112,7 +105,7 @@ class CubeCollection(ChildCollection):
             },
         )
 
-        buckets = res.json()["aggregations"]["t0"]["buckets"]
+        buckets = res["aggregations"]["t0"]["buckets"]
         intervals = []
 
         for bucket in buckets:
@@ -166,4 +159,6 @@ class CubeCollection(ChildCollection):
             content=content
         )
 
-        return CubeCollection(self._sumo, self._case_uuid, query, self._pit)
+        return self._derive(
+            CubeCollection(self._sumo, self._case_uuid, query, self._pit)
+        )
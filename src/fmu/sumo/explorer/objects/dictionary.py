@@ -1,6 +1,6 @@
 """Module containing class for dictionary object"""
 import json
-from typing import Dict
+from typing import Dict, List
 from sumo.wrapper import SumoClient
 from fmu.sumo.explorer.objects._child import Child
 
@@ -10,22 +10,32 @@ class Dictionary(Child):
 
     _parsed: dict
 
-    def __init__(self, sumo: SumoClient, metadata: Dict) -> None:
+    def __init__(
+        self, sumo: SumoClient, metadata: Dict, select: List[str] = None
+    ) -> None:
         """
         Args:
             sumo (SumoClient): connection to Sumo
             metadata (dict): dictionary metadata
+            select (List[str]): metadata fields fetched, if not all
         """
         self._parsed = None
 
-        super().__init__(sumo, metadata)
+        super().__init__(sumo, metadata, select)
 
     @property
     def blob(self) -> bytes:
         """Object blob"""
         if self._blob is None:
-            res = self._sumo.get(f"/objects('{self.uuid}')/blob")
-            self._blob = res.content
+            self._blob = self._get_blob_content()
+
+        return self._blob
+
+    @property
+    async def blob_async(self) -> bytes:
+        """Object blob"""
+        if self._blob is None:
+            self._blob = await self._get_blob_content_async()
 
         return self._blob
 
@@ -25,13 +25,8 @@ class DictionaryCollection(ChildCollection):
         """
         super().__init__("dictionary", sumo, case_uuid, query, pit)
 
-    def __getitem__(self, index) -> Dictionary:
-        doc = super().__getitem__(index)
-        return Dictionary(self._sumo, doc)
-
-    async def getitem_async(self, index: int) -> Dictionary:
-        doc = await super().getitem_async(index)
-        return Dictionary(self._sumo, doc)
+    def _to_object(self, doc: Dict) -> Dictionary:
+        return Dictionary(self._sumo, doc, self._fields)
 
     def filter(
         self,
@@ -68,6 +63,8 @@ class DictionaryCollection(ChildCollection):
             content=content
         )
 
-        return DictionaryCollection(
-            self._sumo, self._case_uuid, query, self._pit
+        return self._derive(
+            DictionaryCollection(
+                self._sumo, self._case_uuid, query, self._pit
+            )
         )
@@ -1,5 +1,5 @@
 """Module containing class for polygons object"""
-from typing import Dict
+from typing import Dict, List
 import pandas as pd
 from sumo.wrapper import SumoClient
 from fmu.sumo.explorer.objects._child import Child
@@ -9,13 +9,16 @@ from warnings import warn
 class Polygons(Child):
     """Class representig a polygons object in Sumo"""
 
-    def __init__(self, sumo: SumoClient, metadata: Dict) -> None:
+    def __init__(
+        self, sumo: SumoClient, metadata: Dict, select: List[str] = None
+    ) -> None:
         """
         Args:
             sumo (SumoClient): connection to Sumo
             metadata (dict): polygon metadata
+            select (List[str]): metadata fields fetched, if not all
         """
-        super().__init__(sumo, metadata)
+        super().__init__(sumo, metadata, select)
 
     def to_pandas(self) -> pd.DataFrame:
         """Get polygons object as a DataFrame
@@ -25,13 +25,8 @@ class PolygonsCollection(ChildCollection):
         """
         super().__init__("polygons", sumo, case_uuid, query, pit)
 
-    def __getitem__(self, index) -> Polygons:
-        doc = super().__getitem__(index)
-        return Polygons(self._sumo, doc)
-
-    async def getitem_async(self, index: int) -> Polygons:
-        doc = await super().getitem_async(index)
-        return Polygons(self._sumo, doc)
+    def _to_object(self, doc: Dict) -> Polygons:
+        return Polygons(self._sumo, doc, self._fields)
 
     def filter(
         self,
@@ -64,6 +59,6 @@ class PolygonsCollection(ChildCollection):
             content=content
         )
 
-        return PolygonsCollection(
-            self._sumo, self._case_uuid, query, self._pit
+        return self._derive(
+            PolygonsCollection(self._sumo, self._case_uuid, query, self._pit)
         )
@@ -1,13 +1,32 @@
 """Module containing class for collection of surfaces"""
 
+import asyncio
+import hashlib
+import threading
+import zipfile
+from pathlib import PurePath
 from typing import Union, List, Dict, Tuple
 from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 from xtgeo import RegularSurface, surface_from_file
 from sumo.wrapper import SumoClient
 from fmu.sumo.explorer.objects._child_collection import ChildCollection
 from fmu.sumo.explorer.objects.surface import Surface
 from fmu.sumo.explorer.timefilter import TimeFilter
 from fmu.sumo.explorer.pit import Pit
+from fmu.sumo.explorer.cache import get_aggregation_cache
+from fmu.sumo.explorer.surface_statistics import (
+    MERGEABLE_OPERATIONS,
+    SurfaceAccumulator,
+    SurfaceStack,
+    merge_statistics,
+)
+
+try:
+    import xarray
+except ImportError:
+    xarray = None
 
 TIMESTAMP_QUERY = {
     "bool": {
@@ -16,6 +35,166 @@ TIMESTAMP_QUERY = {
     }
 }
 
+_STACK_FIELDS = [
+    "fmu.realization.id",
+    "data.spec",
+    "data.format",
+    "_sumo.blob_md5",
+    "file.checksum_md5",
+]
+
+
+# Metadata fields of the groupby names accepted by aggregate_many, other
+# names are taken as dotted metadata paths
+_GROUPBY_FIELDS = {
+    "name": ["data.name"],
+    "tagname": ["data.tagname"],
+    "content": ["data.content"],
+    "iteration": ["fmu.iteration.name"],
+    "realization": ["fmu.realization.id"],
+    "time": ["data.time.t0.value", "data.time.t1.value"],
+}
+
+
+def _groupby_fields(groupby: List[str]) -> List[List[str]]:
+    return [_GROUPBY_FIELDS.get(field, [field]) for field in groupby]
+
+
+def _group_key(surface: Surface, fields: List[List[str]]) -> Tuple:
+    """Get the group of a surface, with one value per groupby name
+
+    A time is a timestamp, or a (t0, t1) tuple for an interval.
+    """
+    key = []
+    for paths in fields:
+        values = [surface._get_property(path.split(".")) for path in paths]
+        if len(values) == 1 or values[1] is None:
+            key.append(values[0])
+        else:
+            key.append(tuple(values))
+    return tuple(key)
+
+
+def _chunk_ids(ids: List[str], chunk_size: int = None) -> List[List[str]]:
+    if chunk_size is None or len(ids) <= chunk_size:
+        return [ids]
+
+    return [
+        ids[start : start + chunk_size]
+        for start in range(0, len(ids), chunk_size)
+    ]
+
+
+def _chunk_operations(operations: List[str]) -> List[str]:
+    """Get the operations to request per chunk for merging operations
+
+    Raises:
+        ValueError: if an operation cannot be merged across chunks
+    """
+    for operation in operations:
+        if operation not in MERGEABLE_OPERATIONS:
+            raise ValueError(
+                f"Operation cannot be computed in chunks: {operation}"
+            )
+
+    if "std" in operations and "mean" not in operations:
+        return operations + ["mean"]
+
+    return operations
+
+
+def _check_stack_members(members: List[Surface]) -> List[Surface]:
+    if any(surface.realization is None for surface in members):
+        raise ValueError("Only realization surfaces can be stacked")
+
+    members = sorted(members, key=lambda surface: surface.realization)
+    realizations = [surface.realization for surface in members]
+
+    if len(set(realizations)) != len(realizations):
+        raise ValueError("Several surfaces belong to the same realization")
+
+    for surface in members[1:]:
+        if surface.spec != members[0].spec:
+            raise ValueError("Surfaces do not share the same grid spec")
+
+    return members
+
+
+def _make_data_array(members: List[Surface], values: np.ma.MaskedArray):
+    if xarray is None:
+        raise ImportError("to_xarray requires xarray to be installed")
+
+    return xarray.DataArray(
+        values.data,
+        dims=("realization", "col", "row"),
+        coords={"realization": [s.realization for s in members]},
+        attrs=members[0].spec,
+    )
+
+
+def _split_aggregation(content: bytes, operations: List[str]) -> Dict:
+    """Split an aggregation response into one surface file per operation
+
+    A single operation gives a single surface. Several operations give a
+    zip archive with one surface file per operation, named after it.
+
+    Args:
+        content (bytes): aggregation response content
+        operations (List[str]): aggregation operations requested
+
+    Returns:
+        Dict[str, bytes]: surface file content by operation, or None if
+        the response does not hold one surface per operation
+    """
+    if len(operations) == 1:
+        return {operations[0]: content}
+
+    if not zipfile.is_zipfile(BytesIO(content)):
+        return None
+
+    results = {}
+    with zipfile.ZipFile(BytesIO(content)) as archive:
+        for name in archive.namelist():
+            operation = PurePath(name).stem
+            if operation in operations:
+                results[operation] = archive.read(name)
+
+    if any(operation not in results for operation in operations):
+        return None
+
+    return results
+
+
+def _aggregation_key(object_ids: List[str]) -> str:
+    """Key of an aggregation in the aggregation cache
+
+    The aggregated objects alone determine the results, so the key is a
+    hash of their sorted ids, whatever query found them.
+    """
+    ids = "\n".join(sorted(set(object_ids)))
+    return hashlib.sha256(ids.encode()).hexdigest()
+
+
+def _get_cached_results(key: str, operations: List[str]) -> Dict:
+    cache = get_aggregation_cache()
+    results = {}
+
+    if cache is not None:
+        for operation in operations:
+            content = cache.get(key, operation)
+            if content is not None:
+                results[operation] = content
+
+    return results
+
+
+def _cache_results(key: str, results: Dict) -> None:
+    cache = get_aggregation_cache()
+
+    if cache is not None:
+        for operation, content in results.items():
+            cache.put(key, operation, content)
+
 
 class SurfaceCollection(ChildCollection):
     """Class representing a collection of surface objects in Sumo"""
@@ -37,14 +216,34 @@ class SurfaceCollection(ChildCollection):
         super().__init__("surface", sumo, case_uuid, query, pit)
 
         self._aggregation_cache = {}
+        self._local_aggregation = False
+
+    def local_aggregation(self, enabled: bool = True) -> "SurfaceCollection":
+        """Compute aggregations locally instead of in Sumo
+
+        In local mode, the surfaces of the collection are streamed and
+        stacked, and all statistics (mean, min, max, std, p10, p50, p90)
+        are computed in one pass the first time any of them is asked for.
+
+        The mode is kept by collections filtered from this one.
+
+        Args:
+            enabled (bool): use local aggregation
+
+        Returns:
+            SurfaceCollection: the collection itself, to allow chaining
+        """
+        self._local_aggregation = enabled
+        return self
 
-    def __getitem__(self, index) -> Surface:
-        doc = super().__getitem__(index)
-        return Surface(self._sumo, doc)
+    def _derive(self, collection: "SurfaceCollection") -> "SurfaceCollection":
+        collection = super()._derive(collection)
+        collection._local_aggregation = self._local_aggregation
 
-    async def getitem_async(self, index: int) -> Surface:
-        doc = await super().getitem_async(index)
-        return Surface(self._sumo, doc)
+        return collection
+
+    def _to_object(self, doc: Dict) -> Surface:
+        return Surface(self._sumo, doc, self._fields)
 
     @property
     def timestamps(self) -> List[str]:
@@ -63,9 +262,8 @@ class SurfaceCollection(ChildCollection):
     @property
     def intervals(self) -> List[Tuple]:
         """List of unique intervals in SurfaceCollection"""
-        res = self._sumo.post(
-            "/search",
-            json={
+        res = self._utils.search(
+            {
                 "query": self._query,
                 "aggs": {
                     "t0": {
@@ -83,7 +281,7 @@ class SurfaceCollection(ChildCollection):
             },
         )
 
-        buckets = res.json()["aggregations"]["t0"]["buckets"]
+        buckets = res["aggregations"]["t0"]["buckets"]
         intervals = []
 
         for bucket in buckets:
@@ -97,9 +295,8 @@ class SurfaceCollection(ChildCollection):
     @property
     async def intervals_async(self) -> List[Tuple]:
         """List of unique intervals in SurfaceCollection"""
-        res = await self._sumo.post_async(
-            "/search",
-            json={
+        res = await self._utils.search_async(
+            {
                 "query": self._query,
                 "aggs": {
                     "t0": {
@@ -117,7 +314,7 @@ class SurfaceCollection(ChildCollection):
             },
         )
 
-        buckets = res.json()["aggregations"]["t0"]["buckets"]
+        buckets = res["aggregations"]["t0"]["buckets"]
         intervals = []
 
         for bucket in buckets:
@@ -128,39 +325,561 @@ class SurfaceCollection(ChildCollection):
 
         return intervals
 
-    def _aggregate(self, operation: str) -> RegularSurface:
+    def _aggregate_locally(self, operation: str) -> RegularSurface:
         if operation not in self._aggregation_cache:
-            objects = self._utils.get_objects(500, self._query, ["_id"])
-            object_ids = list(map(lambda obj: obj["_id"], objects))
+            stack = SurfaceStack(len(self))
 
-            res = self._sumo.post(
-                "/surface/aggregate",
-                json={"operation": [operation], "object_ids": object_ids},
-            )
+            for surface in self.stream():
+                stack.add(surface.to_regular_surface())
 
-            self._aggregation_cache[operation] = surface_from_file(
-                BytesIO(res.content)
-            )
+            self._aggregation_cache.update(stack.statistics())
 
         return self._aggregation_cache[operation]
 
-    async def _aggregate_async(self, operation: str) -> RegularSurface:
+    async def _aggregate_locally_async(self, operation: str) -> RegularSurface:
         if operation not in self._aggregation_cache:
-            objects = await self._utils.get_objects_async(
-                500, self._query, ["_id"]
-            )
-            object_ids = list(map(lambda obj: obj["_id"], objects))
+            stack = SurfaceStack(await self.length_async())
+
+            async for surface in self.stream_async():
+                stack.add(await surface.to_regular_surface_async())
+
+            self._aggregation_cache.update(stack.statistics())
+
+        return self._aggregation_cache[operation]
+
+    def accumulate(
+        self, value_range: Tuple[float, float] = None, bins: int = 32
+    ) -> SurfaceAccumulator:
+        """Compute statistics of the surfaces incrementally
+
+        The surfaces are streamed, and each one is added to the statistics
+        and released, so memory use does not grow with the number of
+        surfaces. Accumulators of different collections can be merged.
+
+        Args:
+            value_range (Tuple[float, float]): range of the histograms used
+                for percentiles, percentiles are not available if None
+            bins (int): number of histogram bins per node, each taking 4
+                bytes per node
+
+        Returns:
+            SurfaceAccumulator: statistics of the surfaces
+
+        Examples:
+
+            Merge statistics of two iterations::
+
+                acc = iter0.accumulate().merge(iter1.accumulate())
+                mean = acc.statistics(["mean"])["mean"]
+        """
+        accumulator = SurfaceAccumulator(value_range, bins)
+
+        for surface in self.stream():
+            accumulator.add(surface.to_regular_surface())
+
+        return accumulator
+
+    async def accumulate_async(
+        self, value_range: Tuple[float, float] = None, bins: int = 32
+    ) -> SurfaceAccumulator:
+        """Compute statistics of the surfaces incrementally
+
+        Args:
+            value_range (Tuple[float, float]): range of the histograms used
+                for percentiles, percentiles are not available if None
+            bins (int): number of histogram bins per node, each taking 4
+                bytes per node
+
+        Returns:
+            SurfaceAccumulator: statistics of the surfaces
+        """
+        accumulator = SurfaceAccumulator(value_range, bins)
+
+        async for surface in self.stream_async():
+            accumulator.add(await surface.to_regular_surface_async())
 
-            res = await self._sumo.post_async(
-                "/surface/aggregate",
-                json={"operation": [operation], "object_ids": object_ids},
+        return accumulator
+
+    def _stack_members(self) -> List[Surface]:
+        """Get the surfaces to stack, sorted by realization
+
+        Raises:
+            ValueError: if the surfaces do not share one grid spec, or
+                several surfaces belong to the same realization
+        """
+        members = [surface for surface in self.select(_STACK_FIELDS)]
+        return _check_stack_members(members)
+
+    async def _stack_members_async(self) -> List[Surface]:
+        members = [
+            surface
+            async for surface in self.select(_STACK_FIELDS)
+        ]
+        return _check_stack_members(members)
+
+    @staticmethod
+    def _stack(
+        members: List[Surface], path: str, concurrency: int
+    ) -> np.ma.MaskedArray:
+        stack = SurfaceStack(len(members), path)
+
+        def fill(index: int) -> None:
+            content = members[index]._get_blob_content()
+            stack.add(surface_from_file(BytesIO(content)), index)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            # Consume the results to raise the first error
+            list(executor.map(fill, range(len(members))))
+
+        return stack.values
+
+    @staticmethod
+    async def _stack_async(
+        members: List[Surface], path: str, concurrency: int
+    ) -> np.ma.MaskedArray:
+        stack = SurfaceStack(len(members), path)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fill(index: int) -> None:
+            async with semaphore:
+                content = await members[index]._get_blob_content_async()
+                stack.add(surface_from_file(BytesIO(content)), index)
+
+        await asyncio.gather(*[fill(i) for i in range(len(members))])
+
+        return stack.values
+
+    def to_numpy(
+        self, path: str = None, concurrency: int = 8
+    ) -> np.ma.MaskedArray:
+        """Stack the surfaces into one array
+
+        The array has shape (realizations, ncol, nrow) and is sorted by
+        realization, see `realizations`. It is allocated once, and each
+        surface is decoded and copied into its own slice as soon as it is
+        downloaded, so only `concurrency` surfaces are held at a time.
+
+        Args:
+            path (str): path of a .npy file to memory-map the values to,
+                the values are held in memory if None
+            concurrency (int): max number of surfaces downloaded at once
+
+        Returns:
+            np.ma.MaskedArray: surface values, masked where undefined
+
+        Examples:
+
+            Stack surfaces too large for memory into a file::
+
+                values = surfs.to_numpy("/scratch/stack.npy")
+        """
+        return self._stack(self._stack_members(), path, concurrency)
+
+    async def to_numpy_async(
+        self, path: str = None, concurrency: int = 8
+    ) -> np.ma.MaskedArray:
+        """Stack the surfaces into one array
+
+        Args:
+            path (str): path of a .npy file to memory-map the values to,
+                the values are held in memory if None
+            concurrency (int): max number of surfaces downloaded at once
+
+        Returns:
+            np.ma.MaskedArray: surface values, masked where undefined
+        """
+        members = await self._stack_members_async()
+        return await self._stack_async(members, path, concurrency)
+
+    def to_xarray(self, path: str = None, concurrency: int = 8):
+        """Stack the surfaces into an xarray DataArray
+
+        Requires xarray. The dimensions are realization, col and row, with
+        realization ids as coordinates and the grid spec as attributes.
+
+        Args:
+            path (str): path of a .npy file to memory-map the values to,
+                the values are held in memory if None
+            concurrency (int): max number of surfaces downloaded at once
+
+        Returns:
+            xarray.DataArray: surface values, NaN where undefined
+        """
+        members = self._stack_members()
+        values = self._stack(members, path, concurrency)
+        return _make_data_array(members, values)
+
+    async def to_xarray_async(self, path: str = None, concurrency: int = 8):
+        """Stack the surfaces into an xarray DataArray
+
+        Args:
+            path (str): path of a .npy file to memory-map the values to,
+                the values are held in memory if None
+            concurrency (int): max number of surfaces downloaded at once
+
+        Returns:
+            xarray.DataArray: surface values, NaN where undefined
+        """
+        members = await self._stack_members_async()
+        values = await self._stack_async(members, path, concurrency)
+        return _make_data_array(members, values)
+
+    def _get_object_ids(self) -> List[str]:
+        return self._utils.get_object_ids(self._query)
+
+    async def _get_object_ids_async(self) -> List[str]:
+        return await self._utils.get_object_ids_async(self._query)
+
+    def _request_statistics(
+        self,
+        object_ids: List[str],
+        operations: List[str],
+        semaphore: threading.Semaphore = None,
+    ) -> Dict[str, RegularSurface]:
+        key = _aggregation_key(object_ids)
+        results = _get_cached_results(key, operations)
+        missing = [op for op in operations if op not in results]
+
+        if len(missing) > 0:
+            fetched = self._fetch_aggregation(object_ids, missing, semaphore)
+            _cache_results(key, fetched)
+            results.update(fetched)
+
+        return {
+            op: surface_from_file(BytesIO(results[op])) for op in operations
+        }
+
+    async def _request_statistics_async(
+        self,
+        object_ids: List[str],
+        operations: List[str],
+        semaphore: asyncio.Semaphore = None,
+    ) -> Dict[str, RegularSurface]:
+        key = _aggregation_key(object_ids)
+        results = _get_cached_results(key, operations)
+        missing = [op for op in operations if op not in results]
+
+        if len(missing) > 0:
+            fetched = await self._fetch_aggregation_async(
+                object_ids, missing, semaphore
             )
+            _cache_results(key, fetched)
+            results.update(fetched)
+
+        return {
+            op: surface_from_file(BytesIO(results[op])) for op in operations
+        }
+
+    def _post_aggregation(
+        self,
+        object_ids: List[str],
+        operations: List[str],
+        semaphore: threading.Semaphore = None,
+    ) -> bytes:
+        if semaphore is not None:
+            with semaphore:
+                return self._post_aggregation(object_ids, operations)
+
+        res = self._sumo.post(
+            "/surface/aggregate",
+            json={"operation": operations, "object_ids": object_ids},
+        )
+        return res.content
 
-            self._aggregation_cache[operation] = surface_from_file(
-                BytesIO(res.content)
+    async def _post_aggregation_async(
+        self,
+        object_ids: List[str],
+        operations: List[str],
+        semaphore: asyncio.Semaphore = None,
+    ) -> bytes:
+        if semaphore is not None:
+            async with semaphore:
+                return await self._post_aggregation_async(
+                    object_ids, operations
+                )
+
+        res = await self._sumo.post_async(
+            "/surface/aggregate",
+            json={"operation": operations, "object_ids": object_ids},
+        )
+        return res.content
+
+    def _fetch_aggregation(
+        self,
+        object_ids: List[str],
+        operations: List[str],
+        semaphore: threading.Semaphore = None,
+    ) -> Dict[str, bytes]:
+        """Aggregate surfaces for several operations in one request
+
+        If the response cannot be split per operation, the operations are
+        requested one at a time. A semaphore, if given, bounds the number
+        of requests in flight across callers.
+        """
+        content = self._post_aggregation(object_ids, operations, semaphore)
+        results = _split_aggregation(content, operations)
+
+        if results is None:
+            results = {
+                operation: self._post_aggregation(
+                    object_ids, [operation], semaphore
+                )
+                for operation in operations
+            }
+
+        return results
+
+    async def _fetch_aggregation_async(
+        self,
+        object_ids: List[str],
+        operations: List[str],
+        semaphore: asyncio.Semaphore = None,
+    ) -> Dict[str, bytes]:
+        """Aggregate surfaces for several operations in one request
+
+        If the response cannot be split per operation, the operations are
+        requested one at a time, concurrently. A semaphore, if given,
+        bounds the number of requests in flight across callers.
+        """
+        content = await self._post_aggregation_async(
+            object_ids, operations, semaphore
+        )
+        results = _split_aggregation(content, operations)
+
+        if results is None:
+            contents = await asyncio.gather(
+                *[
+                    self._post_aggregation_async(
+                        object_ids, [operation], semaphore
+                    )
+                    for operation in operations
+                ]
             )
+            results = dict(zip(operations, contents))
 
-        return self._aggregation_cache[operation]
+        return results
+
+    def _group_object_ids(
+        self, groupby: List[str]
+    ) -> Dict[Tuple, List[str]]:
+        fields = _groupby_fields(groupby)
+        select = [path for paths in fields for path in paths]
+        groups = {}
+
+        for surface in self.select(select).stream():
+            key = _group_key(surface, fields)
+            groups.setdefault(key, []).append(surface.uuid)
+
+        return groups
+
+    async def _group_object_ids_async(
+        self, groupby: List[str]
+    ) -> Dict[Tuple, List[str]]:
+        fields = _groupby_fields(groupby)
+        select = [path for paths in fields for path in paths]
+        groups = {}
+
+        async for surface in self.select(select).stream_async():
+            key = _group_key(surface, fields)
+            groups.setdefault(key, []).append(surface.uuid)
+
+        return groups
+
+    def aggregate_many(
+        self,
+        groupby: List[str],
+        operations: List[str],
+        concurrency: int = 8,
+    ) -> Dict[Tuple, Dict[str, RegularSurface]]:
+        """Aggregate groups of surfaces concurrently
+
+        The members of all groups are found in one paged search, fetching
+        only the groupby fields. The groups are then aggregated with at
+        most `concurrency` aggregation requests in flight at a time.
+
+        Args:
+            groupby (List[str]): names to group by, among name, tagname,
+                content, iteration, realization and time, or dotted
+                metadata paths
+            operations (List[str]): aggregation operations, among mean,
+                min, max, std, p10, p50 and p90
+            concurrency (int): max number of concurrent aggregation
+                requests
+
+        Returns:
+            Dict[Tuple, Dict[str, RegularSurface]]: aggregated surface by
+            operation, by group. A group key has one value per groupby
+            name, and a time interval is a (t0, t1) tuple.
+
+        Examples:
+
+            Get the mean of every surface at every time::
+
+                means = case.surfaces.filter(stage="realization")
+                groups = means.aggregate_many(["name", "time"], ["mean"])
+                groups[("Valysar Fm.", "2018-01-01T00:00:00")]["mean"]
+        """
+        groups = self._group_object_ids(groupby)
+        semaphore = threading.Semaphore(concurrency)
+
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            futures = {
+                key: executor.submit(
+                    self._request_statistics,
+                    object_ids,
+                    operations,
+                    semaphore,
+                )
+                for key, object_ids in groups.items()
+            }
+
+            return {key: future.result() for key, future in futures.items()}
+
+    async def aggregate_many_async(
+        self,
+        groupby: List[str],
+        operations: List[str],
+        concurrency: int = 8,
+    ) -> Dict[Tuple, Dict[str, RegularSurface]]:
+        """Aggregate groups of surfaces concurrently
+
+        Args:
+            groupby (List[str]): names to group by, among name, tagname,
+                content, iteration, realization and time, or dotted
+                metadata paths
+            operations (List[str]): aggregation operations, among mean,
+                min, max, std, p10, p50 and p90
+            concurrency (int): max number of concurrent aggregation
+                requests
+
+        Returns:
+            Dict[Tuple, Dict[str, RegularSurface]]: aggregated surface by
+            operation, by group
+        """
+        groups = await self._group_object_ids_async(groupby)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        results = await asyncio.gather(
+            *[
+                self._request_statistics_async(
+                    object_ids, operations, semaphore
+                )
+                for object_ids in groups.values()
+            ]
+        )
+
+        return dict(zip(groups.keys(), results))
+
+    def _aggregate(self, operation: str) -> RegularSurface:
+        return self.statistics([operation])[operation]
+
+    async def _aggregate_async(self, operation: str) -> RegularSurface:
+        return (await self.statistics_async([operation]))[operation]
+
+    def statistics(
+        self, operations: List[str], chunk_size: int = None
+    ) -> Dict[str, RegularSurface]:
+        """Perform several aggregations in one request
+
+        With `chunk_size`, the surfaces are aggregated in chunks of at most
+        `chunk_size` surfaces, and the statistics of the chunks are merged.
+        Only mean, min, max and std can be merged, and only for chunks
+        with the same undefined nodes, since chunks are weighted by their
+        number of surfaces.
+
+        Args:
+            operations (List[str]): aggregation operations, among mean,
+                min, max, std, p10, p50 and p90
+            chunk_size (int): max number of surfaces per aggregation
+                request, no limit if None
+
+        Returns:
+            Dict[str, RegularSurface]: aggregated surface by operation
+
+        Raises:
+            ValueError: if chunked statistics cannot be merged
+
+        Examples:
+
+            Get statistics for a fan chart::
+
+                stats = surfs.statistics(["mean", "p10", "p90"])
+                stats["p90"].quickplot()
+        """
+        cache = self._aggregation_cache
+        missing = [op for op in operations if op not in cache]
+
+        if len(missing) > 0 and self._local_aggregation:
+            self._aggregate_locally(missing[0])
+        elif len(missing) > 0:
+            object_ids = self._get_object_ids()
+            chunks = _chunk_ids(object_ids, chunk_size)
+
+            if len(chunks) == 1:
+                surfaces = self._request_statistics(object_ids, missing)
+            else:
+                chunk_operations = _chunk_operations(missing)
+                parts = [
+                    (
+                        len(chunk),
+                        self._request_statistics(chunk, chunk_operations),
+                    )
+                    for chunk in chunks
+                ]
+                surfaces = merge_statistics(parts, missing)
+
+            self._aggregation_cache.update(surfaces)
+
+        return {op: self._aggregation_cache[op] for op in operations}
+
+    async def statistics_async(
+        self, operations: List[str], chunk_size: int = None
+    ) -> Dict[str, RegularSurface]:
+        """Perform several aggregations in one request
+
+        With `chunk_size`, the chunks are aggregated concurrently.
+
+        Args:
+            operations (List[str]): aggregation operations, among mean,
+                min, max, std, p10, p50 and p90
+            chunk_size (int): max number of surfaces per aggregation
+                request, no limit if None
+
+        Returns:
+            Dict[str, RegularSurface]: aggregated surface by operation
+        """
+        cache = self._aggregation_cache
+        missing = [op for op in operations if op not in cache]
+
+        if len(missing) > 0 and self._local_aggregation:
+            await self._aggregate_locally_async(missing[0])
+        elif len(missing) > 0:
+            object_ids = await self._get_object_ids_async()
+            chunks = _chunk_ids(object_ids, chunk_size)
+
+            if len(chunks) == 1:
+                surfaces = await self._request_statistics_async(
+                    object_ids, missing
+                )
+            else:
+                chunk_operations = _chunk_operations(missing)
+                results = await asyncio.gather(
+                    *[
+                        self._request_statistics_async(
+                            chunk, chunk_operations
+                        )
+                        for chunk in chunks
+                    ]
+                )
+                parts = [
+                    (len(chunk), result)
+                    for chunk, result in zip(chunks, results)
+                ]
+                surfaces = merge_statistics(parts, missing)
+
+            self._aggregation_cache.update(surfaces)
+
+        return {op: self._aggregation_cache[op] for op in operations}
 
     def filter(
         self,
@@ -252,7 +971,9 @@ class SurfaceCollection(ChildCollection):
             is_prediction=is_prediction,
         )
 
-        return SurfaceCollection(self._sumo, self._case_uuid, query, self._pit)
+        return self._derive(
+            SurfaceCollection(self._sumo, self._case_uuid, query, self._pit)
+        )
 
     def mean(self) -> RegularSurface:
         """Perform a mean aggregation"""
@@ -1,38 +1,73 @@
 """module containing class for table"""
 import logging
+from typing import List
 import pandas as pd
 import pyarrow as pa
 import pyarrow.parquet as pq
 import pyarrow.feather as pf
+import pyarrow.compute as pc
 from sumo.wrapper import SumoClient
 from fmu.sumo.explorer.objects._child import Child
+from fmu.sumo.explorer.objects._document import Document
+from fmu.sumo.explorer.objects._range_file import RangeFile
 from warnings import warn
 
 
+def _project(table: pa.Table, columns: List[str], filter: pc.Expression):
+    """Select rows and columns of an arrow table
+
+    Rows are selected first, since the filter may use columns which are not
+    selected.
+    """
+    if filter is not None:
+        table = table.filter(filter)
+
+    if columns is not None:
+        table = table.select(columns)
+
+    return table
+
+
 class Table(Child):
     """Class representing a table object in Sumo"""
 
-    def __init__(self, sumo: SumoClient, metadata: dict) -> None:
+    def __init__(
+        self, sumo: SumoClient, metadata: dict, select: List[str] = None
+    ) -> None:
         """
         Args:
             sumo (SumoClient): connection to Sumo
             metadata: (dict): child object metadata
+            select (List[str]): metadata fields fetched, if not all
         """
-        super().__init__(sumo, metadata)
+        super().__init__(sumo, metadata, select)
         self._dataframe = None
         self._arrowtable = None
         self._logger = logging.getLogger("__name__" + ".Table")
 
 
-    def to_pandas(self) -> pd.DataFrame:
+    def to_pandas(
+        self, columns: List[str] = None, filter: pc.Expression = None
+    ) -> pd.DataFrame:
         """Return object as a pandas DataFrame
 
+        Only the given columns, and rows matching the filter, are decoded.
+        Such partial reads are not kept on the object. For parquet blobs
+        which have not been downloaded, only the needed column chunks are
+        transferred.
+
+        Args:
+            columns (List[str]): columns to read, all if None
+            filter (pc.Expression): filter on rows to read, all if None
+
         Returns:
             DataFrame: A DataFrame object
         """
+        if columns is not None or filter is not None:
+            return self.to_arrow(columns, filter).to_pandas()
 
         if self._dataframe is None:
-            if self["data"]["format"] == "csv":
+            if self.dataformat == "csv":
                 worked = "csv"
                 self._logger.debug("Treating blob as csv")
                 try:
@@ -58,15 +93,31 @@ class Table(Child):
         self._logger.debug("Read blob as %s to return pandas", worked)
         return self._dataframe
 
-    async def to_pandas_async(self) -> pd.DataFrame:
+    async def to_pandas_async(
+        self, columns: List[str] = None, filter: pc.Expression = None
+    ) -> pd.DataFrame:
         """Return object as a pandas DataFrame
 
+        Only the given columns, and rows matching the filter, are decoded.
+        Such partial reads are not kept on the object.
+
+        Args:
+            columns (List[str]): columns to read, all if None
+            filter (pc.Expression): filter on rows to read, all if None
+
         Returns:
             DataFrame: A DataFrame object
         """
+        if columns is not None or filter is not None:
+            if self._arrowtable is not None:
+                return _project(self._arrowtable, columns, filter).to_pandas()
+
+            return self._read_projected(
+                await self.blob_async, columns, filter
+            ).to_pandas()
 
         if self._dataframe is None:
-            if self["data"]["format"] == "csv":
+            if self.dataformat == "csv":
                 worked = "csv"
                 self._logger.debug("Treating blob as csv")
                 try:
@@ -93,14 +144,38 @@ class Table(Child):
         return self._dataframe
 
 
-    def to_arrow(self) -> pa.Table:
+    def to_arrow(
+        self, columns: List[str] = None, filter: pc.Expression = None
+    ) -> pa.Table:
         """Return object as an arrow Table
 
+        Only the given columns, and rows matching the filter, are decoded.
+        Such partial reads are not kept on the object. For parquet blobs
+        which have not been downloaded, only the needed column chunks are
+        transferred.
+
+        Args:
+            columns (List[str]): columns to read, all if None
+            filter (pc.Expression): filter on rows to read, all if None
+
         Returns:
             pa.Table: _description_
         """
+        if columns is not None or filter is not None:
+            if self._arrowtable is not None:
+                return _project(self._arrowtable, columns, filter)
+
+            if not self._is_blob_local() and self.dataformat == "parquet":
+                table = self._read_ranged(columns, filter)
+
+                if table is not None:
+                    return table
+
+            return self._read_projected(
+                self.blob, columns, filter
+            )
         if self._arrowtable is None:
-            if self["data"]["format"] == "arrow":
+            if self.dataformat == "arrow":
                 try:
                     worked = "feather"
                     self._arrowtable = pf.read_table(self.blob)
@@ -124,14 +199,30 @@ class Table(Child):
 
         return self._arrowtable
 
-    async def to_arrow_async(self) -> pa.Table:
+    async def to_arrow_async(
+        self, columns: List[str] = None, filter: pc.Expression = None
+    ) -> pa.Table:
         """Return object as an arrow Table
 
+        Only the given columns, and rows matching the filter, are decoded.
+        Such partial reads are not kept on the object.
+
+        Args:
+            columns (List[str]): columns to read, all if None
+            filter (pc.Expression): filter on rows to read, all if None
+
         Returns:
             pa.Table: _description_
         """
+        if columns is not None or filter is not None:
+            if self._arrowtable is not None:
+                return _project(self._arrowtable, columns, filter)
+
+            return self._read_projected(
+                await self.blob_async, columns, filter
+            )
         if self._arrowtable is None:
-            if self["data"]["format"] == "arrow":
+            if self.dataformat == "arrow":
                 try:
                     worked = "feather"
                     self._arrowtable = pf.read_table(await self.blob_async)
@@ -154,3 +245,91 @@ class Table(Child):
             self._logger.debug("Read blob as %s to return arrow", worked)
 
         return self._arrowtable
+
+    def _read_projected(
+        self, blob, columns: List[str], filter: pc.Expression
+    ) -> pa.Table:
+        """Read selected columns and rows of a blob into an arrow table
+
+        Args:
+            blob (BytesIO): object blob
+            columns (List[str]): columns to read, all if None
+            filter (pc.Expression): filter on rows to read, all if None
+
+        Returns:
+            pa.Table: the selected data
+        """
+        blob.seek(0)
+
+        # Columns used by the filter are only dropped after filtering
+        read_columns = columns if filter is None else None
+
+        if self.dataformat == "csv":
+            table = pa.Table.from_pandas(
+                pd.read_csv(blob, usecols=read_columns)
+            )
+            return _project(table, columns, filter)
+
+        try:
+            table = pf.read_table(blob, columns=read_columns)
+            self._logger.debug("Read projected blob as feather")
+        except pa.lib.ArrowInvalid:
+            blob.seek(0)
+            self._logger.debug("Read projected blob as parquet")
+            return pq.read_table(blob, columns=columns, filters=filter)
+
+        return _project(table, columns, filter)
+
+    def parquet_file(self) -> pq.ParquetFile:
+        """Open the blob as a parquet file without downloading it
+
+        The file reads the parquet footer and then only the column chunks
+        and row groups asked for, using HTTP range requests. Close it with
+        `close(force=True)` when done, to release its connections.
+
+        Returns:
+            pq.ParquetFile: the parquet file
+
+        Raises:
+            pa.lib.ArrowInvalid: if the blob is not parquet
+        """
+        size = Document._get_property(self, ["_sumo", "blob_size"])
+        return pq.ParquetFile(RangeFile(self._blob_url(), size))
+
+    def _blob_url(self) -> str:
+        """Get authorized url of the blob"""
+        res = self._sumo.get(f"/objects('{self.uuid}')/blob/authuri")
+        try:
+            res = res.json()
+            return res.get("baseuri") + self.uuid + "?" + res.get("auth")
+        except Exception:
+            return res.text
+
+    def _read_ranged(
+        self, columns: List[str], filter: pc.Expression
+    ) -> pa.Table:
+        """Read selected columns and rows of a remote parquet blob
+
+        Row groups which the filter excludes, according to their
+        statistics, are not transferred.
+
+        Args:
+            columns (List[str]): columns to read, all if None
+            filter (pc.Expression): filter on rows to read, all if None
+
+        Returns:
+            pa.Table: the selected data, or None if blob is not parquet
+        """
+        size = Document._get_property(self, ["_sumo", "blob_size"])
+
+        with RangeFile(self._blob_url(), size) as range_file:
+            try:
+                table = pq.read_table(
+                    range_file, columns=columns, filters=filter
+                )
+            except pa.lib.ArrowInvalid:
+                return None
+
+        self._logger.debug("Read projected blob as ranged parquet")
+
+        return table
@@ -1,8 +1,19 @@
 """module containing class for table"""
+from typing import List
+import pandas as pd
+import pyarrow as pa
 from fmu.sumo.explorer.objects.case import Case
 from fmu.sumo.explorer._utils import Utils
 from fmu.sumo.explorer.objects.table import Table
 
+_COLUMN_TABLE_FIELDS = [
+    "data.format",
+    "data.spec.columns",
+    "_sumo.blob_md5",
+    "_sumo.blob_size",
+    "file.checksum_md5",
+]
+
 
 class AggregatedTable:
     """Class for representing an aggregated table in Sumo"""
@@ -73,8 +84,8 @@ class AggregatedTable:
                 "query": {"bool": {"must": must}},
             }
 
-            res = self._sumo.post("/search", json=query)
-            doc = res.json()["hits"]["hits"][0]
+            res = self._utils.search(query)
+            doc = res["hits"]["hits"][0]
             self._parameters = doc["_source"]["fmu"]["iteration"]["parameters"]
 
         return self._parameters
@@ -104,8 +115,8 @@ class AggregatedTable:
                 "query": {"bool": {"must": must}},
             }
 
-            res = await self._sumo.post_async("/search", json=query)
-            doc = res.json()["hits"]["hits"][0]
+            res = await self._utils.search_async(query)
+            doc = res["hits"]["hits"][0]
             self._parameters = doc["_source"]["fmu"]["iteration"]["parameters"]
 
         return self._parameters
@@ -120,3 +131,127 @@ class AggregatedTable:
             raise IndexError(
                 f"Column: '{column}' does not exist, try again"
             ) from i_ex
+
+    def to_arrow(self, columns: List[str], concurrency: int = 8) -> pa.Table:
+        """Get several columns as one arrow table
+
+        The tables holding the columns are found with one query, their
+        blobs are downloaded concurrently, and the columns are assembled
+        on the key columns (typically DATE and REAL) the tables share.
+
+        Args:
+            columns (List[str]): column names
+            concurrency (int): max number of concurrent downloads
+
+        Returns:
+            pa.Table: the key columns followed by the given columns
+        """
+        collection = self._column_tables(columns)
+        tables, errors = collection.download_blobs(concurrency)
+
+        if len(errors) > 0:
+            raise next(iter(errors.values()))
+
+        return self._assemble(tables, columns)
+
+    async def to_arrow_async(
+        self, columns: List[str], concurrency: int = 8
+    ) -> pa.Table:
+        """Get several columns as one arrow table
+
+        Args:
+            columns (List[str]): column names
+            concurrency (int): max number of concurrent downloads
+
+        Returns:
+            pa.Table: the key columns followed by the given columns
+        """
+        collection = self._column_tables(columns)
+        tables, errors = await collection.download_blobs_async(concurrency)
+
+        if len(errors) > 0:
+            raise next(iter(errors.values()))
+
+        return self._assemble(tables, columns)
+
+    def to_pandas(
+        self, columns: List[str], concurrency: int = 8
+    ) -> pd.DataFrame:
+        """Get several columns as one DataFrame
+
+        Args:
+            columns (List[str]): column names
+            concurrency (int): max number of concurrent downloads
+
+        Returns:
+            DataFrame: the key columns followed by the given columns
+        """
+        return self.to_arrow(columns, concurrency).to_pandas()
+
+    async def to_pandas_async(
+        self, columns: List[str], concurrency: int = 8
+    ) -> pd.DataFrame:
+        """Get several columns as one DataFrame
+
+        Args:
+            columns (List[str]): column names
+            concurrency (int): max number of concurrent downloads
+
+        Returns:
+            DataFrame: the key columns followed by the given columns
+        """
+        table = await self.to_arrow_async(columns, concurrency)
+        return table.to_pandas()
+
+    def _column_tables(self, columns: List[str]):
+        """Get collection of the tables holding the given columns"""
+        return self._collection.filter(column=columns).select(
+            _COLUMN_TABLE_FIELDS
+        )
+
+    def _assemble(self, tables: List[Table], columns: List[str]) -> pa.Table:
+        """Combine the given columns of tables sharing key columns
+
+        Args:
+            tables (List[Table]): tables holding the columns
+            columns (List[str]): column names
+
+        Returns:
+            pa.Table: the key columns followed by the given columns
+        """
+        holders = {}
+        keys = None
+
+        for table in tables:
+            spec = table["data"]["spec"]["columns"]
+            own_keys = [column for column in spec if column not in columns]
+            keys = own_keys if keys is None else [
+                key for key in keys if key in own_keys
+            ]
+
+            for column in spec:
+                if column in columns and column not in holders:
+                    holders[column] = table
+
+        for column in columns:
+            if column not in holders:
+                raise IndexError(
+                    f"Column: '{column}' does not exist, try again"
+                )
+
+        result = None
+        for column in columns:
+            part = holders[column].to_arrow(columns=keys + [column])
+
+            if result is None:
+                result = part
+            elif result.select(keys).equals(part.select(keys)):
+                # Same key values in the same order, so the column can be
+                # appended without copying or joining
+                result = result.append_column(
+                    part.field(column), part.column(column)
+                )
+            else:
+                result = result.join(part, keys)
+
+        return result
@@ -25,13 +25,8 @@ class TableCollection(ChildCollection):
         """
         super().__init__("table", sumo, case_uuid, query, pit)
 
-    def __getitem__(self, index) -> Table:
-        doc = super().__getitem__(index)
-        return Table(self._sumo, doc)
-
-    async def getitem_async(self, index: int) -> Table:
-        doc = await super().getitem_async(index)
-        return Table(self._sumo, doc)
+    def _to_object(self, doc: Dict) -> Table:
+        return Table(self._sumo, doc, self._fields)
 
     @property
     def columns(self) -> List[str]:
@@ -82,4 +77,6 @@ class TableCollection(ChildCollection):
             uuid=uuid,
             content=content
         )
-        return TableCollection(self._sumo, self._case_uuid, query, self._pit)
+        return self._derive(
+            TableCollection(self._sumo, self._case_uuid, query, self._pit)
+        )
@@ -0,0 +1,424 @@
+"""Module containing classes for computing statistics of surfaces"""
+import threading
+import warnings
+from typing import Dict, List, Tuple, Union
+import numpy as np
+from xtgeo import RegularSurface
+
+OPERATIONS = ["mean", "min", "max", "std", "p10", "p50", "p90"]
+
+_PERCENTILES = {"p10": 10, "p50": 50, "p90": 90}
+
+MERGEABLE_OPERATIONS = ["mean", "min", "max", "std"]
+
+
+class SurfaceStack:
+    """Class for stacking realizations of a surface into one masked array
+
+    The stack is allocated once, and each surface is copied into its own
+    slice as it arrives, so surfaces can be decoded one at a time. The
+    values can be memory-mapped to a file, for stacks too large for memory.
+    """
+
+    def __init__(self, count: int, path: str = None) -> None:
+        """
+        Args:
+            count (int): max number of surfaces in the stack
+            path (str): path of a .npy file to memory-map the values to,
+                the values are held in memory if None
+        """
+        self._count = count
+        self._path = path
+        self._size = 0
+        self._template = None
+        self._values = None
+        self._mask = None
+        self._lock = threading.Lock()
+
+    @property
+    def values(self) -> np.ma.MaskedArray:
+        """Stacked values, masked and NaN where undefined"""
+        if self._size == 0:
+            raise ValueError("No surfaces to stack")
+
+        return np.ma.masked_array(
+            self._values[: self._size], mask=self._mask[: self._size]
+        )
+
+    def _allocate(self, surface: RegularSurface) -> None:
+        self._template = surface
+        shape = (self._count,) + surface.values.shape
+
+        if self._path is None:
+            self._values = np.empty(shape, dtype=np.float64)
+        else:
+            self._values = np.lib.format.open_memmap(
+                self._path, mode="w+", dtype=np.float64, shape=shape
+            )
+
+        self._mask = np.ones(shape, dtype=bool)
+
+    def add(self, surface: RegularSurface, index: int = None) -> None:
+        """Add a surface to the stack
+
+        Args:
+            surface (RegularSurface): surface on the same grid as the
+                surfaces already added
+            index (int): slice to copy the surface into, the one after the
+                last surface added if None. Surfaces may be added from
+                several threads at distinct indexes.
+        """
+        with self._lock:
+            if self._template is None:
+                self._allocate(surface)
+            elif not self._template.compare_topology(surface, strict=False):
+                raise ValueError("Surfaces do not share the same grid")
+
+            index = self._size if index is None else index
+
+            if index >= self._count:
+                raise IndexError("Surface stack is full")
+
+            self._size = max(self._size, index + 1)
+
+        values = np.ma.asarray(surface.values)
+        self._values[index] = values.filled(np.nan)
+        self._mask[index] = np.ma.getmaskarray(values)
+
+    def statistics(self, operations: List[str] = None) -> Dict:
+        """Compute statistics over the stacked surfaces
+
+        Undefined values are ignored, the way xtgeo does for masked
+        surface values. Nodes that are undefined in every surface are
+        undefined in the results.
+
+        Args:
+            operations (List[str]): operations among OPERATIONS, all if
+                None
+
+        Returns:
+            Dict[str, RegularSurface]: one surface per operation
+        """
+        if self._size == 0:
+            raise ValueError("No surfaces to compute statistics for")
+
+        operations = OPERATIONS if operations is None else operations
+        values = self._values[: self._size]
+        stack = np.ma.masked_array(values, mask=self._mask[: self._size])
+        undefined = stack.count(axis=0) == 0
+
+        results = {}
+        for operation in operations:
+            if operation == "mean":
+                results[operation] = stack.mean(axis=0)
+            elif operation == "min":
+                results[operation] = stack.min(axis=0)
+            elif operation == "max":
+                results[operation] = stack.max(axis=0)
+            elif operation == "std":
+                results[operation] = stack.std(axis=0)
+            elif operation not in _PERCENTILES:
+                raise ValueError(f"Unknown operation: {operation}")
+
+        percentiles = [op for op in operations if op in _PERCENTILES]
+        if len(percentiles) > 0:
+            with warnings.catch_warnings():
+                # Nodes undefined in every surface give all-NaN slices
+                warnings.simplefilter("ignore", RuntimeWarning)
+                computed = np.nanpercentile(
+                    np.where(self._mask[: self._size], np.nan, values),
+                    [_PERCENTILES[op] for op in percentiles],
+                    axis=0,
+                )
+
+            for operation, result in zip(percentiles, computed):
+                results[operation] = result
+
+        return {
+            operation: self._make_surface(result, undefined)
+            for operation, result in results.items()
+        }
+
+    def _make_surface(self, values, undefined) -> RegularSurface:
+        surface = self._template.copy()
+        surface.values = np.ma.masked_array(
+            np.ma.getdata(values), mask=undefined
+        )
+        return surface
+
+
+def merge_statistics(
+    parts: List[Tuple[Union[int, np.ndarray], Dict[str, RegularSurface]]],
+    operations: List[str],
+) -> Dict[str, RegularSurface]:
+    """Merge statistics computed over disjoint groups of surfaces
+
+    Each group is weighted, per node, by its number of surfaces defined
+    at that node. When only the number of surfaces of each group is known,
+    the groups must have the same undefined nodes, since a group with
+    undefined nodes would otherwise be given too much weight there.
+    Percentiles cannot be merged this way.
+
+    Args:
+        parts (List[Tuple[Union[int, np.ndarray], Dict]]): number of
+            surfaces in each group, or number of surfaces defined at each
+            node, and statistics of the group by operation. Merging std
+            requires the mean of each group.
+        operations (List[str]): operations among MERGEABLE_OPERATIONS
+
+    Returns:
+        Dict[str, RegularSurface]: merged surface by operation
+
+    Raises:
+        ValueError: if an operation cannot be merged, or if groups with
+            different undefined nodes are only given surface counts
+    """
+    for operation in operations:
+        if operation not in MERGEABLE_OPERATIONS:
+            raise ValueError(f"Operation cannot be merged: {operation}")
+
+    def stack(operation):
+        return np.ma.stack(
+            [np.ma.asarray(stats[operation].values) for _, stats in parts]
+        )
+
+    template = parts[0][1][operations[0]]
+    shape = template.values.shape
+    masks = [
+        np.ma.getmaskarray(stats[operations[0]].values) for _, stats in parts
+    ]
+
+    if any(np.ndim(count) == 0 for count, _ in parts) and any(
+        not np.array_equal(mask, masks[0]) for mask in masks[1:]
+    ):
+        raise ValueError(
+            "Groups have different undefined nodes, "
+            "merging them requires counts per node"
+        )
+
+    weights = np.stack(
+        [
+            np.broadcast_to(np.asarray(count, dtype=np.float64), shape)
+            for count, _ in parts
+        ]
+    )
+
+    results = {}
+    if "mean" in operations or "std" in operations:
+        means = stack("mean")
+        mean = np.ma.average(means, axis=0, weights=weights)
+        results["mean"] = mean
+    if "min" in operations:
+        results["min"] = stack("min").min(axis=0)
+    if "max" in operations:
+        results["max"] = stack("max").max(axis=0)
+    if "std" in operations:
+        # Combine within-group and between-group variance
+        spread = stack("std") ** 2 + (means - mean) ** 2
+        variance = np.ma.average(spread, axis=0, weights=weights)
+        results["std"] = np.ma.sqrt(variance)
+
+    merged = {}
+    for operation in operations:
+        surface = template.copy()
+        surface.values = np.ma.asarray(results[operation])
+        merged[operation] = surface
+
+    return merged
+
+
+class SurfaceAccumulator:
+    """Class for computing statistics of surfaces incrementally
+
+    Surfaces are added one at a time, and only running statistics are
+    kept: count, mean and sum of squared deviations (Welford's algorithm),
+    min and max per node. Accumulators fed with different surfaces, for
+    example in different processes, can be merged.
+
+    Percentiles are approximated from a histogram per node, kept only when
+    a value range is given. Values outside the range are counted in the
+    outermost bins. The histograms take ncol * nrow * bins * 4 bytes, for
+    example 128 MB for a 1000 x 1000 grid with the default 32 bins.
+    """
+
+    def __init__(
+        self, value_range: Tuple[float, float] = None, bins: int = 32
+    ) -> None:
+        """
+        Args:
+            value_range (Tuple[float, float]): range of the percentile
+                histograms, percentiles are not available if None
+            bins (int): number of histogram bins per node, each taking 4
+                bytes per node
+        """
+        self._range = value_range
+        self._bins = bins
+        self._template = None
+        self._count = None
+        self._mean = None
+        self._m2 = None
+        self._min = None
+        self._max = None
+        self._hist = None
+
+    @property
+    def count(self) -> int:
+        """Max number of surfaces added for any node"""
+        return 0 if self._count is None else int(self._count.max())
+
+    def _allocate(self, template: RegularSurface) -> None:
+        shape = template.values.shape
+        self._template = template
+        self._count = np.zeros(shape, dtype=np.int64)
+        self._mean = np.zeros(shape, dtype=np.float64)
+        self._m2 = np.zeros(shape, dtype=np.float64)
+        self._min = np.full(shape, np.inf)
+        self._max = np.full(shape, -np.inf)
+        if self._range is not None:
+            # Counts of up to 2**32 - 1 surfaces per bin
+            self._hist = np.zeros(shape + (self._bins,), dtype=np.uint32)
+
+    def _check(self, surface: RegularSurface) -> None:
+        if not self._template.compare_topology(surface, strict=False):
+            raise ValueError("Surfaces do not share the same grid")
+
+    def add(self, surface: RegularSurface) -> None:
+        """Add a surface to the statistics
+
+        Args:
+            surface (RegularSurface): surface on the same grid as the
+                surfaces already added
+        """
+        if self._template is None:
+            self._allocate(surface)
+        else:
+            self._check(surface)
+
+        values = np.ma.asarray(surface.values)
+        data = np.ma.getdata(values).astype(np.float64)
+        defined = ~np.ma.getmaskarray(values) & np.isfinite(data)
+        data = np.where(defined, data, 0.0)
+
+        self._count += defined
+        delta = data - self._mean
+        count = np.maximum(self._count, 1)
+        self._mean += np.where(defined, delta / count, 0.0)
+        self._m2 += np.where(defined, delta * (data - self._mean), 0.0)
+        self._min = np.where(defined, np.minimum(self._min, data), self._min)
+        self._max = np.where(defined, np.maximum(self._max, data), self._max)
+
+        if self._hist is not None:
+            nodes = np.flatnonzero(defined)
+            bins = self._bin_index(data.ravel()[nodes])
+            # Each node occurs once, so plain fancy indexing increments
+            self._hist.reshape(-1, self._bins)[nodes, bins] += 1
+
+    def _bin_index(self, data: np.ndarray) -> np.ndarray:
+        low, high = self._range
+        index = np.floor((data - low) / (high - low) * self._bins)
+        return np.clip(index, 0, self._bins - 1).astype(np.int64)
+
+    def merge(self, other: "SurfaceAccumulator") -> "SurfaceAccumulator":
+        """Merge statistics of other surfaces into this accumulator
+
+        Args:
+            other (SurfaceAccumulator): accumulator with the same value
+                range and bins, fed with surfaces on the same grid
+
+        Returns:
+            SurfaceAccumulator: this accumulator
+        """
+        if (other._range, other._bins) != (self._range, self._bins):
+            raise ValueError("Accumulators have different histograms")
+
+        if other._template is None:
+            return self
+
+        if self._template is None:
+            self._allocate(other._template)
+        else:
+            self._check(other._template)
+
+        # Chan et al. update for combining mean and M2 of two groups
+        count = self._count + other._count
+        safe_count = np.maximum(count, 1)
+        delta = other._mean - self._mean
+        self._mean = self._mean + delta * other._count / safe_count
+        self._m2 = (
+            self._m2
+            + other._m2
+            + delta**2 * self._count * other._count / safe_count
+        )
+        self._count = count
+        self._min = np.minimum(self._min, other._min)
+        self._max = np.maximum(self._max, other._max)
+
+        if self._hist is not None:
+            self._hist += other._hist
+
+        return self
+
+    def statistics(self, operations: List[str] = None) -> Dict:
+        """Compute statistics of the surfaces added so far
+
+        Args:
+            operations (List[str]): operations among OPERATIONS, all if
+                None
+
+        Returns:
+            Dict[str, RegularSurface]: one surface per operation
+        """
+        if self._template is None:
+            raise ValueError("No surfaces to compute statistics for")
+
+        operations = OPERATIONS if operations is None else operations
+        undefined = self._count == 0
+        count = np.maximum(self._count, 1)
+
+        results = {}
+        for operation in operations:
+            if operation == "mean":
+                results[operation] = self._mean
+            elif operation == "min":
+                results[operation] = self._min
+            elif operation == "max":
+                results[operation] = self._max
+            elif operation == "std":
+                results[operation] = np.sqrt(self._m2 / count)
+            elif operation in _PERCENTILES:
+                results[operation] = self._percentile(
+                    _PERCENTILES[operation]
+                )
+            else:
+                raise ValueError(f"Unknown operation: {operation}")
+
+        surfaces = {}
+        for operation, result in results.items():
+            surface = self._template.copy()
+            surface.values = np.ma.masked_array(
+                np.where(undefined, 0.0, result), mask=undefined
+            )
+            surfaces[operation] = surface
+
+        return surfaces
+
+    def _percentile(self, percentile: float) -> np.ndarray:
+        if self._hist is None:
+            raise ValueError("Percentiles require a value range")
+
+        low, high = self._range
+        width = (high - low) / self._bins
+        cumulative = np.cumsum(self._hist, axis=-1)
+        target = self._count * percentile / 100.0
+
+        # First bin where the cumulative count reaches the target, and
+        # linear interpolation within that bin
+        index = np.argmax(cumulative >= target[..., None], axis=-1)
+        index = index[..., None]
+        in_bin = np.take_along_axis(self._hist, index, axis=-1)[..., 0]
+        before = np.take_along_axis(cumulative, index, axis=-1)[..., 0]
+        before = before - in_bin
+        fraction = (target - before) / np.maximum(in_bin, 1)
+        values = low + (index[..., 0] + fraction) * width
+
+        return np.clip(values, self._min, self._max)
@@ -5,10 +5,16 @@ import sys
 
 if not sys.platform.startswith("darwin") and sys.version_info < (3, 12):
     import openvds
+import asyncio
+import gc
+import io
 import logging
 import json
+import time
 from pathlib import Path
+import zipfile
 from uuid import UUID
+import numpy as np
 import pytest
 from xtgeo import RegularSurface
 from context import (
@@ -16,10 +22,27 @@ from context import (
     Utils,
     Case,
     CaseCollection,
+    Surface,
     SurfaceCollection,
+    Table,
 )
 
 from sumo.wrapper import SumoClient
+from fmu.sumo.explorer import (
+    AggregationCache,
+    BlobCache,
+    SearchCache,
+    SurfaceAccumulator,
+)
+from fmu.sumo.explorer.cache import get_aggregation_cache, set_search_cache
+from fmu.sumo.explorer.surface_statistics import (
+    SurfaceStack,
+    merge_statistics,
+)
+from fmu.sumo.explorer._utils import _search_key, _search_ttl
+from fmu.sumo.explorer._query import Query
+from fmu.sumo.explorer._single_flight import single_flight
+from fmu.sumo.explorer.objects.surface_collection import _aggregation_key
 
 
 TEST_DATA = Path("data")
@@ -286,6 +309,340 @@ def test_case_surfaces_pagination(test_case: Case):
     assert count == len(surfs)
 
 
+def test_case_surfaces_len_counts_only(test_case: Case):
+    """Test that len() counts the surfaces without fetching any"""
+    surfs = test_case.surfaces.filter(stage="realization")
+
+    count = len(surfs)
+
+    assert len(surfs._items) == 0
+    assert count == len(list(surfs))
+
+
+def test_cases_len_counts_only(explorer: Explorer, case_name: str):
+    """Test that len() of cases skips the case overviews"""
+    cases = explorer.cases.filter(name=case_name)
+
+    assert len(cases) == 1
+    assert len(cases._items) == 0
+    assert cases[0].name == case_name
+
+
+def test_case_surfaces_random_access(token: str, case_uuid: str):
+    """Test that indexing and slicing match iteration order"""
+    explorer = Explorer("dev", token=token, keep_alive="1m")
+    surfs = explorer.get_case_by_uuid(case_uuid).surfaces
+    uuids = [surf.uuid for surf in surfs]
+
+    surfs = explorer.get_case_by_uuid(case_uuid).surfaces
+
+    assert surfs[-1].uuid == uuids[-1]
+    assert [surf.uuid for surf in surfs[1:10:3]] == uuids[1:10:3]
+    assert [surf.uuid for surf in surfs[-5:]] == uuids[-5:]
+
+
+def test_case_surfaces_page_size(token: str, case_uuid: str):
+    """Test that fixed and adaptive page sizes yield the same surfaces"""
+    explorer = Explorer("dev", token=token, keep_alive="1m")
+    surfs = explorer.get_case_by_uuid(case_uuid).surfaces
+    uuids = [surf.uuid for surf in surfs]
+
+    surfs = explorer.get_case_by_uuid(case_uuid).surfaces.page_size(7)
+
+    assert [surf.uuid for surf in surfs] == uuids
+    assert [surf.uuid for surf in surfs.stream()] == uuids
+
+    with pytest.raises(ValueError):
+        surfs.page_size(0)
+
+
+def test_case_surfaces_prefetch(test_case: Case):
+    """Test that read-ahead iteration yields every surface exactly once"""
+    surfs = test_case.surfaces.prefetch(2)
+    uuids = [surf.uuid for surf in surfs]
+
+    assert len(uuids) == len(surfs)
+    assert len(set(uuids)) == len(uuids)
+
+
+def test_case_surfaces_scan(token: str, case_uuid: str):
+    """Test that a sliced scroll returns every surface exactly once"""
+    explorer = Explorer("dev", token=token, keep_alive="1m")
+    surfs = explorer.get_case_by_uuid(case_uuid).surfaces
+    uuids = [surf.uuid for surf in surfs.scan(slices=4)]
+
+    assert len(uuids) == len(surfs)
+    assert len(set(uuids)) == len(uuids)
+
+
+def test_case_surfaces_stream(test_case: Case):
+    """Test that streaming yields every surface without retaining them"""
+    surfs = test_case.surfaces
+    count = 0
+
+    for surf in surfs.stream():
+        assert isinstance(surf, Surface)
+        count += 1
+
+    assert len(surfs._items) == 0
+    assert count == len(surfs)
+
+
+def test_case_surfaces_select(test_case: Case):
+    """Test that selected fields are fetched and others loaded lazily"""
+    surf = test_case.surfaces.select(["data.name"])[0]
+
+    assert surf.name is not None
+    assert "fmu" not in surf.metadata
+    assert surf.iteration is not None
+    assert "fmu" in surf.metadata
+
+
+def test_case_surfaces_select_new_collection(test_case: Case):
+    """Test that select keeps the collection and survives filtering"""
+    surfs = test_case.surfaces.prefetch(2)
+    uuids = [surf.uuid for surf in surfs]
+    selected = surfs.select(["data.name", "fmu.realization"])
+
+    assert [surf.uuid for surf in selected] == uuids
+    assert len(surfs._items) == len(uuids)
+
+    surf = selected.filter(aggregation=True)[0]
+
+    # A selected but missing field does not load the full metadata
+    assert surf.realization is None
+    assert "data" in surf.metadata and "file" not in surf.metadata
+
+
+def test_case_surfaces_download_blobs(test_case: Case):
+    """Test concurrent download of the blobs of a surface collection"""
+    surfs = test_case.surfaces.filter(
+        name="Valysar Fm.", tagname="FACIES_Fraction_Channel"
+    )
+    done = []
+
+    objects, errors = surfs.download_blobs(
+        concurrency=4, callback=lambda obj, error: done.append(obj.uuid)
+    )
+
+    assert len(errors) == 0
+    assert len(done) == len(objects) == len(surfs)
+    for surf in objects:
+        assert surf._blob is not None
+        assert isinstance(surf.to_regular_surface(), RegularSurface)
+
+
+def test_case_surfaces_local_aggregation(test_case: Case):
+    """Test that local aggregation matches aggregation in Sumo"""
+    surfs = test_case.surfaces.filter(
+        stage="realization",
+        name="Valysar Fm.",
+        tagname="FACIES_Fraction_Channel",
+    )
+    local = surfs.filter().local_aggregation()
+
+    for operation in ["mean", "min", "max"]:
+        expected = getattr(surfs, operation)()
+        actual = getattr(local, operation)()
+
+        assert isinstance(actual, RegularSurface)
+        assert abs(actual.values.mean() - expected.values.mean()) < 1e-4
+
+
+def test_case_surfaces_local_aggregation_survives_filter(test_case: Case):
+    """Test that filtering keeps local aggregation"""
+    local = test_case.surfaces.local_aggregation().filter(
+        stage="realization",
+        name="Valysar Fm.",
+        tagname="FACIES_Fraction_Channel",
+    )
+
+    assert local._local_aggregation
+    assert isinstance(local.mean(), RegularSurface)
+    # Local aggregation computes every statistic in one pass
+    assert "p90" in local._aggregation_cache
+
+
+def test_case_surfaces_statistics(test_case: Case):
+    """Test getting several aggregations at once"""
+    surfs = test_case.surfaces.filter(
+        stage="realization",
+        name="Valysar Fm.",
+        tagname="FACIES_Fraction_Channel",
+    )
+
+    stats = surfs.statistics(["mean", "p10", "p90"])
+
+    assert sorted(stats.keys()) == ["mean", "p10", "p90"]
+    for operation, surface in stats.items():
+        assert isinstance(surface, RegularSurface)
+        assert surfs._aggregation_cache[operation] is surface
+
+
+def test_case_surfaces_aggregation_ids(test_case: Case):
+    """Test that aggregation collects the ids of every member"""
+    surfs = test_case.surfaces.filter(stage="realization")
+
+    assert len(surfs._get_object_ids()) == len(surfs)
+
+
+def test_case_surfaces_chunked_statistics(test_case: Case):
+    """Test that statistics merged from chunks match one aggregation"""
+    surfs = test_case.surfaces.filter(
+        stage="realization",
+        name="Valysar Fm.",
+        tagname="FACIES_Fraction_Channel",
+    )
+    chunked = surfs.filter()
+
+    expected = surfs.statistics(["mean", "min", "max", "std"])
+    actual = chunked.statistics(["mean", "min", "max", "std"], chunk_size=2)
+
+    for operation, surface in expected.items():
+        diff = actual[operation].values.mean() - surface.values.mean()
+        assert abs(diff) < 1e-4
+
+    with pytest.raises(ValueError):
+        chunked.filter().statistics(["p10"], chunk_size=2)
+
+
+def test_case_surfaces_accumulate(test_case: Case):
+    """Test that accumulated statistics match aggregation in Sumo"""
+    surfs = test_case.surfaces.filter(
+        stage="realization",
+        name="Valysar Fm.",
+        tagname="FACIES_Fraction_Channel",
+    )
+
+    reals = surfs.realizations
+    first = surfs.filter(realization=reals[:2]).accumulate((0, 1))
+    rest = surfs.filter(realization=reals[2:]).accumulate((0, 1))
+    accumulator = first.merge(rest)
+    assert isinstance(accumulator, SurfaceAccumulator)
+    assert accumulator.count == len(surfs)
+
+    stats = accumulator.statistics(["mean", "max", "p50"])
+    for operation in ["mean", "max"]:
+        expected = getattr(surfs, operation)()
+        diff = stats[operation].values.mean() - expected.values.mean()
+        assert abs(diff) < 1e-4
+    assert isinstance(stats["p50"], RegularSurface)
+
+
+def test_accumulator_histogram_counts():
+    """Test percentiles from merged 4-byte histograms"""
+    first, rest = SurfaceAccumulator((0, 10)), SurfaceAccumulator((0, 10))
+
+    for value in range(10):
+        surface = RegularSurface(
+            ncol=2, nrow=2, xinc=1.0, yinc=1.0, values=value + 0.5
+        )
+        (first if value < 5 else rest).add(surface)
+
+    accumulator = first.merge(rest)
+    stats = accumulator.statistics(["p50", "mean"])
+
+    assert accumulator._hist.dtype == np.uint32
+    assert accumulator._hist.shape == (2, 2, 32)
+    assert np.allclose(stats["p50"].values, 5.0, atol=0.5)
+    assert np.allclose(stats["mean"].values, 5.0)
+
+
+def test_case_surfaces_to_numpy(test_case: Case, tmp_path):
+    """Test stacking surfaces into one array sorted by realization"""
+    surfs = test_case.surfaces.filter(
+        stage="realization",
+        name="Valysar Fm.",
+        tagname="FACIES_Fraction_Channel",
+    )
+    first = surfs[0]
+
+    values = surfs.to_numpy(str(tmp_path / "stack.npy"))
+
+    assert values.shape == (
+        len(surfs),
+        first.spec["ncol"],
+        first.spec["nrow"],
+    )
+    index = sorted(surfs.realizations).index(first.realization)
+    expected = first.to_regular_surface().values
+    assert abs(values[index].mean() - expected.mean()) < 1e-6
+
+    with pytest.raises(ValueError):
+        test_case.surfaces.filter(realization=0).to_numpy()
+
+
+def test_surface_stack_memmap(tmp_path):
+    """Test filling a memory-mapped stack out of order"""
+    surfaces = [
+        RegularSurface(ncol=3, nrow=4, xinc=1.0, yinc=1.0, values=value)
+        for value in [1.0, 2.0, 3.0]
+    ]
+    surfaces[1].values = np.ma.masked_less(surfaces[1].values, 5.0)
+    path = tmp_path / "stack.npy"
+    stack = SurfaceStack(len(surfaces), str(path))
+
+    for index in [2, 0, 1]:
+        stack.add(surfaces[index], index)
+
+    values = stack.values
+
+    assert values.shape == (3, 3, 4)
+    assert values[1].mask.all()
+    assert np.isnan(values.data[1]).all()
+    assert values[0, 0, 0] == 1.0 and values[2, 0, 0] == 3.0
+    assert np.load(path).shape == (3, 3, 4)
+
+
+def test_merge_statistics_weights_defined_nodes():
+    """Test merging groups of surfaces undefined at different nodes"""
+    values = [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]
+    surfaces = [
+        RegularSurface(ncol=1, nrow=2, xinc=1.0, yinc=1.0, values=value)
+        for value in values
+    ]
+    surfaces[1].values = np.ma.masked_array([[3.0, 4.0]], [[False, True]])
+    surfaces[2].values = np.ma.masked_array([[5.0, 6.0]], [[False, True]])
+    groups = [surfaces[:2], surfaces[2:]]
+    parts = []
+
+    for group in groups:
+        stack = SurfaceStack(len(group))
+        for surface in group:
+            stack.add(surface)
+        counts = np.ma.count(stack.values, axis=0)
+        parts.append((counts, stack.statistics(["mean", "std"])))
+
+    merged = merge_statistics(parts, ["mean", "std"])
+    whole = SurfaceStack(len(surfaces))
+    for surface in surfaces:
+        whole.add(surface)
+    expected = whole.statistics(["mean", "std"])
+
+    for operation in ["mean", "std"]:
+        assert np.allclose(
+            merged[operation].values, expected[operation].values
+        )
+
+    sizes = [(len(group), stats) for group, (_, stats) in zip(groups, parts)]
+    with pytest.raises(ValueError):
+        merge_statistics(sizes, ["mean"])
+
+
+def test_case_surfaces_aggregate_many(test_case: Case):
+    """Test aggregating several groups of surfaces at once"""
+    surfs = test_case.surfaces.filter(
+        stage="realization", tagname="FACIES_Fraction_Channel"
+    )
+
+    groups = surfs.aggregate_many(["name"], ["mean"])
+
+    assert sorted(key[0] for key in groups.keys()) == sorted(surfs.names)
+    expected = surfs.filter(name="Valysar Fm.").mean()
+    actual = groups[("Valysar Fm.",)]["mean"]
+    assert abs(actual.values.mean() - expected.values.mean()) < 1e-4
+
+
 def test_get_case_by_uuid(explorer: Explorer, case_uuid: str, case_name: str):
     """Test that explorer.get_case_by_uuid returns the specified case"""
     case = explorer.get_case_by_uuid(case_uuid)
@@ -295,6 +652,19 @@ def test_get_case_by_uuid(explorer: Explorer, case_uuid: str, case_name: str):
     assert case.name == case_name
 
 
+def test_get_objects_by_uuids(explorer: Explorer, test_case: Case):
+    """Test that explorer resolves several uuids in order and typed"""
+    uuids = [surf.uuid for surf in test_case.surfaces.filter(realization=0)]
+    uuids += [table.uuid for table in test_case.tables.filter(realization=0)]
+    uuids.reverse()
+
+    objects = explorer.get_objects_by_uuids(uuids)
+
+    assert [obj.uuid for obj in objects] == uuids
+    assert any(isinstance(obj, Surface) for obj in objects)
+    assert any(isinstance(obj, Table) for obj in objects)
+
+
 @pytest.mark.skipif(
     sys.platform.startswith("darwin") or sys.version_info > (3, 11),
     reason="do not run OpenVDS SEGYImport on mac os or python 3.12",
@@ -320,6 +690,183 @@ def test_seismic_case_by_uuid(explorer: Explorer, seismic_case_uuid: str):
     assert "SEGYTraceHeader" in channel_list
 
 
+def test_blob_cache_lru(tmp_path):
+    """Test that the blob cache evicts least recently used blobs"""
+    cache = BlobCache(tmp_path, max_size=25)
+
+    cache.put("uuid-a", "md5", b"a" * 10)
+    cache.put("uuid-b", "md5", b"b" * 10)
+    assert cache.get("uuid-a", "md5") == b"a" * 10
+    assert cache.get("uuid-a", "other-md5") is None
+
+    cache.put("uuid-c", "md5", b"c" * 10)
+
+    assert cache.get("uuid-b", "md5") is None
+    assert cache.get("uuid-a", "md5") == b"a" * 10
+    assert cache.get("uuid-c", "md5") == b"c" * 10
+
+
+def test_blob_cache_scans_only_when_full(tmp_path, monkeypatch):
+    """Test that writes below the max size do not scan the directory"""
+    cache = BlobCache(tmp_path, max_size=100)
+    cache.put("uuid-a", "md5", b"a" * 10)
+
+    scans = []
+    evict = cache._evict
+    monkeypatch.setattr(cache, "_evict", lambda: scans.append(evict()))
+
+    for uuid in ["uuid-b", "uuid-c", "uuid-d"]:
+        cache.put(uuid, "md5", b"x" * 10)
+
+    assert len(scans) == 0
+
+    cache.put("uuid-e", "md5", b"e" * 80)
+
+    assert len(scans) == 1
+    assert cache.get("uuid-a", "md5") is None
+    assert cache.get("uuid-e", "md5") == b"e" * 80
+
+
+def test_aggregation_cache_lru(tmp_path):
+    """Test that the aggregation cache evicts and persists results"""
+    cache = AggregationCache(max_size=25, directory=tmp_path)
+
+    cache.put("key-a", "mean", b"a" * 10)
+    cache.put("key-b", "mean", b"b" * 10)
+    assert cache.get("key-a", "mean") == b"a" * 10
+    assert cache.get("key-a", "max") is None
+
+    cache.put("key-c", "mean", b"c" * 10)
+    cache.clear()
+
+    # Evicted from memory, but persisted on disk
+    assert cache.get("key-b", "mean") == b"b" * 10
+    assert AggregationCache().get("key-b", "mean") is None
+
+
+def test_case_surfaces_shared_aggregation_cache(test_case: Case):
+    """Test that equivalent collections share aggregation results"""
+    cache = get_aggregation_cache()
+    cache.clear()
+    surfs = test_case.surfaces.filter(
+        stage="realization",
+        name="Valysar Fm.",
+        tagname="FACIES_Fraction_Channel",
+    )
+    key = _aggregation_key(surfs._get_object_ids())
+
+    mean = surfs.mean()
+
+    assert cache.get(key, "mean") is not None
+    same = test_case.surfaces.filter(tagname="FACIES_Fraction_Channel")
+    same = same.filter(stage="realization", name="Valysar Fm.")
+    assert abs(same.mean().values.mean() - mean.values.mean()) < 1e-6
+
+
+def test_search_cache_ttl(tmp_path):
+    """Test that the search cache expires and persists responses"""
+    cache = SearchCache(ttl=60, max_entries=1, directory=tmp_path)
+
+    cache.put("key-a", b"a")
+    cache.put("key-b", b"b", ttl=-1)
+
+    assert cache.get("key-b") is None
+    cache.clear()
+    assert cache.get("key-a") == b"a"
+
+
+def test_search_key_canonical():
+    """Test that equivalent searches share a cache key"""
+    query = {"query": {"terms": {"_id": ["b", "a", "a"]}}, "size": 10}
+    same = {"size": 10, "query": {"terms": {"_id": ["a", "b"]}}}
+    pit = dict(query, pit={"id": "pit-id", "keep_alive": "5m"})
+
+    assert _search_key(query) == _search_key(same)
+    assert _search_key(query) != _search_key(pit)
+    assert _search_ttl(pit) == 300
+    assert _search_ttl(query) is None
+
+
+def test_case_surfaces_search_cache(test_case: Case):
+    """Test that equivalent collections reuse cached search responses"""
+    cache = SearchCache()
+    set_search_cache(cache)
+    try:
+        names = test_case.surfaces.names
+        cached = len(cache._entries)
+        assert cached > 0
+        assert test_case.surfaces.filter().names == names
+        assert len(cache._entries) == cached
+    finally:
+        set_search_cache(None)
+
+
+def test_single_flight_coalesces_requests():
+    """Test that identical concurrent requests share one request"""
+    calls = []
+
+    async def request():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return b"result"
+
+    async def run():
+        return await asyncio.gather(
+            *[single_flight("key", request) for _ in range(10)]
+        )
+
+    assert asyncio.run(run()) == [b"result"] * 10
+    assert len(calls) == 1
+
+
+def test_case_surfaces_concurrent_names(test_case: Case):
+    """Test that concurrent identical lookups all get the result"""
+    surfs = test_case.surfaces
+
+    async def run():
+        return await asyncio.gather(
+            *[surfs.filter().names_async for _ in range(5)]
+        )
+
+    results = asyncio.run(run())
+
+    assert all(names == surfs.names for names in results)
+
+
+def test_utils_get_buckets_paging(utils: Utils, case_uuid: str):
+    """Test that bucket paging returns every bucket once"""
+    query = {"term": {"fmu.case.uuid.keyword": case_uuid}}
+    field = "data.name.keyword"
+
+    expected = utils.get_buckets(field, query)
+    paged = utils.get_buckets(field, query, size=3)
+
+    assert len(expected) > 3
+    assert paged == expected
+
+
+def test_case_surfaces_facets(test_case: Case):
+    """Test getting unique values of several fields at once"""
+    fields = ["data.name.keyword", "fmu.realization.id"]
+
+    facets = test_case.surfaces.facets(fields)
+
+    surfs = test_case.surfaces
+    assert facets["data.name.keyword"] == surfs.names
+    assert facets["fmu.realization.id"] == surfs.realizations
+
+
+def test_case_surfaces_facets_keep_timestamps(test_case: Case):
+    """Test that facets do not replace values fetched another way"""
+    surfs = test_case.surfaces
+    timestamps = test_case.surfaces.timestamps
+
+    surfs.facets(["data.time.t0.value"])
+
+    assert surfs.timestamps == timestamps
+    assert all(isinstance(value, str) for value in surfs.timestamps)
+
+
 def test_utils_extend_query_object(utils: Utils):
     """Test extension of query"""
     old = {"bool": {"must": [{"term": {"class.keyword": "surface"}}]}}
@@ -342,3 +889,325 @@ def test_utils_extend_query_object(utils: Utils):
     extended = utils.extend_query_object(extended, new)
 
     assert len(extended["bool"]["must"]) == 3
+
+
+def test_query_extend_shares_structure():
+    """Test that extending a query leaves it unchanged and shares parts"""
+    uuids = [f"uuid-{i}" for i in range(1000)]
+    base = Query({"bool": {"must": [{"terms": {"_id": uuids}}]}})
+    name = {"bool": {"must": [{"term": {"data.name.keyword": "a"}}]}}
+
+    extended = base.extend(name).extend(name)
+    query = extended.to_dict()
+
+    assert len(query["bool"]["must"]) == 2
+    assert query["bool"]["must"][0]["terms"]["_id"] is uuids
+    assert len(base.to_dict()["bool"]["must"]) == 1
+    assert extended.to_dict() is query
+
+
+class FakeResponse:
+    """Response of FakeSumo"""
+
+    def __init__(self, data):
+        self._data = data
+        self.content = json.dumps(data).encode()
+
+    def json(self):
+        return self._data
+
+
+class FakeSumo:
+    """Sumo client searching a list of cases in memory
+
+    Like Elasticsearch, the case overview aggregation returns no more
+    buckets than its size.
+    """
+
+    def __init__(self, count: int, delay: float = 0):
+        self.ids = [f"case-{i:05d}" for i in range(count)]
+        self.sizes = []
+        self.delay = delay
+
+    def post(self, path, json=None):
+        assert path == "/search"
+        time.sleep(self.delay)
+        return FakeResponse(self._search(json))
+
+    async def post_async(self, path, json=None):
+        return self.post(path, json=json)
+
+    def _search(self, query):
+        if "aggs" in query:
+            ids = query["query"]["terms"]["fmu.case.uuid.keyword"]
+            size = query["aggs"]["cases"]["terms"]["size"]
+            empty = {"buckets": []}
+            buckets = [
+                {
+                    "key": uuid,
+                    "iteration_names": empty,
+                    "iteration_uuids": empty,
+                    "data_types": empty,
+                    "iterations": empty,
+                }
+                for uuid in ids[:size]
+            ]
+            return {"aggregations": {"cases": {"buckets": buckets}}}
+
+        start = query.get("from", 0)
+        if "search_after" in query:
+            start = query["search_after"][0] + 1
+
+        size = query["size"]
+        self.sizes.append(size)
+        hits = [
+            {"_id": uuid, "_source": {}, "sort": [start + i]}
+            for i, uuid in enumerate(self.ids[start : start + size])
+        ]
+        total = {"value": len(self.ids)}
+
+        return {"hits": {"total": total, "hits": hits}}
+
+
+def test_cases_overviews_beyond_1000():
+    """Test that every case of large pages gets its overview"""
+    sumo = FakeSumo(5000)
+
+    cases = CaseCollection(sumo)
+    assert [case.uuid for case in cases] == sumo.ids
+    assert max(sumo.sizes) <= 1000
+
+    streamed = [case.uuid for case in CaseCollection(sumo).stream()]
+    assert streamed == sumo.ids
+
+    with pytest.raises(ValueError):
+        CaseCollection(sumo).page_size(5000)
+
+
+def test_page_size_survives_filter():
+    """Test that a filtered collection keeps the page size"""
+    sumo = FakeSumo(50)
+
+    cases = CaseCollection(sumo).page_size(20).filter(status="keep")
+    assert [case.uuid for case in cases] == sumo.ids
+    assert set(sumo.sizes) == {20}
+
+
+def test_prefetch_survives_filter():
+    """Test that a filtered collection keeps reading ahead"""
+    cases = CaseCollection(FakeSumo(50)).prefetch(3).filter(status="keep")
+
+    assert cases._prefetch == 3
+
+
+def test_prefetch_cancelled_when_abandoned():
+    """Test that dropping a collection cancels the pages read ahead"""
+    sumo = FakeSumo(100, delay=0.05)
+    cases = CaseCollection(sumo).page_size(10).prefetch(3)
+
+    for _ in range(11):
+        next(cases)
+
+    pending = list(cases._pending)
+    executor = cases._executor
+    del cases
+    gc.collect()
+    time.sleep(0.2)
+
+    assert any(future.cancelled() for future in pending)
+    assert executor._shutdown
+    assert len(sumo.sizes) < 10
+
+
+def test_async_prefetch_cancelled_when_abandoned():
+    """Test that dropping a collection cancels the async pages read ahead"""
+
+    async def abandon():
+        cases = CaseCollection(FakeSumo(100)).page_size(10).prefetch(3)
+
+        for _ in range(11):
+            await cases.__anext__()
+
+        pending = list(cases._pending_tasks)
+        del cases
+        gc.collect()
+        await asyncio.sleep(0)
+
+        return pending
+
+    pending = asyncio.run(abandon())
+
+    assert any(task.cancelled() for task in pending)
+
+
+def test_select_leaves_read_ahead_to_source():
+    """Test that select does not share the read-ahead of its source"""
+    sumo = FakeSumo(100)
+    cases = CaseCollection(sumo).page_size(10).prefetch(3)
+
+    for _ in range(11):
+        next(cases)
+
+    selected = cases.select(["fmu.case.name"])
+
+    assert selected._executor is None and len(selected._pending) == 0
+    assert [case.uuid for case in cases] == sumo.ids
+
+
+def test_scan_without_pit_does_not_count():
+    """Test that a sequential scan fetches pages without a count request"""
+    sumo = FakeSumo(50)
+
+    cases = CaseCollection(sumo).scan()
+
+    assert [case.uuid for case in cases] == sumo.ids
+    assert 0 not in sumo.sizes
+
+
+def test_cases_slice_beyond_1000():
+    """Test that slicing many cases gets every overview"""
+    sumo = FakeSumo(3000)
+    cases = CaseCollection(sumo)
+
+    assert [case.uuid for case in cases[0:1500]] == sumo.ids[0:1500]
+    assert [case.uuid for case in cases[-3:]] == sumo.ids[-3:]
+    assert cases[2500].uuid == sumo.ids[2500]
+
+    sliced = asyncio.run(CaseCollection(sumo).getitem_async(slice(0, 1500)))
+    assert [case.uuid for case in sliced] == sumo.ids[0:1500]
+    assert max(sumo.sizes) <= 1000
+
+
+class FakeAggregationSumo:
+    """Sumo client aggregating surfaces, recording the operations asked
+
+    Several operations give a zip archive with one file per operation,
+    unless zipped is False.
+    """
+
+    def __init__(self, zipped: bool = True):
+        self.zipped = zipped
+        self.requested = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def post(self, path, json=None):
+        assert path == "/surface/aggregate"
+        operations = json["operation"]
+        self.requested.append(operations)
+
+        if len(operations) == 1 or not self.zipped:
+            return FakeResponse(operations)
+
+        response = FakeResponse(None)
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            for operation in operations:
+                archive.writestr(f"{operation}.gri", operation.encode())
+        response.content = buffer.getvalue()
+
+        return response
+
+    async def post_async(self, path, json=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.post(path, json=json)
+
+
+def test_fetch_aggregation_in_one_request():
+    """Test that several operations are aggregated in one request"""
+    sumo = FakeAggregationSumo()
+    surfs = SurfaceCollection(sumo, "case")
+
+    results = surfs._fetch_aggregation(["a", "b"], ["min", "max"])
+
+    assert results == {"min": b"min", "max": b"max"}
+    assert sumo.requested == [["min", "max"]]
+
+    results = asyncio.run(
+        surfs._fetch_aggregation_async(["a", "b"], ["min", "max"])
+    )
+
+    assert results == {"min": b"min", "max": b"max"}
+
+
+def test_fetch_aggregation_falls_back_to_one_request_per_operation():
+    """Test that an unsplittable response is asked for per operation"""
+    sumo = FakeAggregationSumo(zipped=False)
+    surfs = SurfaceCollection(sumo, "case")
+
+    results = surfs._fetch_aggregation(["a", "b"], ["min", "max"])
+
+    assert results == {"min": b'["min"]', "max": b'["max"]'}
+    assert sumo.requested == [["min", "max"], ["min"], ["max"]]
+
+
+def test_fetch_aggregation_shares_concurrency_limit():
+    """Test that a shared semaphore bounds every aggregation request"""
+    sumo = FakeAggregationSumo(zipped=False)
+    surfs = SurfaceCollection(sumo, "case")
+    operations = ["min", "max", "mean", "std"]
+
+    async def fetch_groups():
+        semaphore = asyncio.Semaphore(2)
+        await asyncio.gather(
+            *[
+                surfs._fetch_aggregation_async([uuid], operations, semaphore)
+                for uuid in ["a", "b", "c"]
+            ]
+        )
+
+    asyncio.run(fetch_groups())
+
+    assert len(sumo.requested) == 3 * (1 + len(operations))
+    assert sumo.max_in_flight == 2
+
+
+class FakeFacetSumo:
+    """Sumo client answering composite aggregations over values in memory
+
+    Like Elasticsearch, a request may hold no more than max_buckets
+    buckets in all.
+    """
+
+    def __init__(self, values: dict, max_buckets: int):
+        self.values = values
+        self.max_buckets = max_buckets
+        self.requests = 0
+
+    def post(self, path, json=None):
+        assert path == "/search"
+        self.requests += 1
+        aggregations = {}
+        total = 0
+
+        for field, agg in json["aggs"].items():
+            composite = agg["composite"]
+            start = composite.get("after", {}).get(field, -1) + 1
+            values = self.values[field][start : start + composite["size"]]
+            total += composite["size"]
+            buckets = [
+                {"key": {field: value}, "doc_count": 1} for value in values
+            ]
+            aggregations[field] = {"buckets": buckets}
+            if len(values) > 0:
+                aggregations[field]["after_key"] = {field: values[-1]}
+
+        assert total <= self.max_buckets
+
+        return FakeResponse({"aggregations": aggregations})
+
+
+def test_facets_share_bucket_limit():
+    """Test that the fields of a facet request share the bucket limit"""
+    values = {"a": list(range(25)), "b": list(range(3)), "c": []}
+    sumo = FakeFacetSumo(values, max_buckets=30)
+
+    facets = Utils(sumo).get_facets(["a", "b", "c"], {}, size=30)
+
+    assert [bucket["key"] for bucket in facets["a"]] == values["a"]
+    assert [bucket["key"] for bucket in facets["b"]] == values["b"]
+    assert facets["c"] == []
+    assert sumo.requests == 2
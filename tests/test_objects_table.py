@@ -7,7 +7,10 @@
 """
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import httpx
 from fmu.sumo.explorer import Explorer, AggregatedTable
+from fmu.sumo.explorer.objects._range_file import RangeFile
 import pytest
 
 # Fixed test case ("Drogon_AHM_2023-02-22") in Sumo/DEV
@@ -41,6 +44,102 @@ def test_table_to_arrow(table):
     assert isinstance(arrow, pa.Table)
 
 
+def test_table_to_arrow_columns(table):
+    """Test reading only some columns with to_arrow() and to_pandas()"""
+    columns = table.to_arrow().column_names[:2]
+    table._arrowtable = None
+
+    arrow = table.to_arrow(columns=columns)
+    assert arrow.column_names == columns
+    assert table._arrowtable is None
+
+    assert list(table.to_pandas(columns=columns).columns) == columns
+
+
+def test_table_to_arrow_filter_on_unselected_column(table):
+    """Test filtering rows on a column which is not read"""
+    first, second = table.to_arrow().column_names[:2]
+    value = table.to_arrow()[first][0]
+    expected = table.to_arrow().filter(pc.field(first) == value)
+
+    arrow = table.to_arrow(columns=[second], filter=pc.field(first) == value)
+    assert arrow.column_names == [second]
+    assert arrow.num_rows == expected.num_rows
+
+    table._arrowtable = None
+    table._blob = None
+
+    arrow = table.to_arrow(columns=[second], filter=pc.field(first) == value)
+    assert arrow.column_names == [second]
+    assert arrow.num_rows == expected.num_rows
+
+
+def test_table_parquet_file(case):
+    """Test opening a parquet table blob without downloading it"""
+    for table in case.tables.filter(realization=0):
+        try:
+            parquet_file = table.parquet_file()
+        except pa.lib.ArrowInvalid:
+            continue
+
+        column = parquet_file.schema_arrow.names[0]
+        assert table.to_arrow(columns=[column]).column_names == [column]
+        assert table._blob is None
+        return
+
+    pytest.skip("No parquet tables in test case")
+
+
+def test_table_projected_read_skips_ranges_unless_parquet(table, monkeypatch):
+    """Test that only parquet blobs are read with range requests"""
+    if table.dataformat == "parquet":
+        pytest.skip("Test table is parquet")
+
+    def fail():
+        raise AssertionError("Range requests used for a non-parquet blob")
+
+    monkeypatch.setattr(table, "_blob_url", fail)
+    column = table.to_arrow().column_names[0]
+    table._arrowtable = None
+    table._blob = None
+
+    assert table.to_arrow(columns=[column]).column_names == [column]
+
+
+def _range_file(blob: bytes, honour_range: bool) -> RangeFile:
+    """Get a RangeFile over a blob served from memory"""
+
+    def handler(request):
+        if not honour_range:
+            return httpx.Response(200, content=blob)
+
+        start, end = request.headers["Range"][6:].split("-")
+        start, end = int(start), int(end)
+        headers = {"Content-Range": f"bytes {start}-{end}/{len(blob)}"}
+        return httpx.Response(
+            206, headers=headers, content=blob[start : end + 1]
+        )
+
+    range_file = RangeFile("http://blob", len(blob))
+    range_file._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return range_file
+
+
+def test_range_file_reads_ranges():
+    """Test that a RangeFile reads the bytes asked for"""
+    with _range_file(b"0123456789", honour_range=True) as range_file:
+        range_file.seek(3)
+        assert range_file.read(4) == b"3456"
+
+
+def test_range_file_rejects_full_responses():
+    """Test that a RangeFile fails on a server ignoring the range"""
+    with _range_file(b"0123456789", honour_range=False) as range_file:
+        range_file.seek(3)
+        with pytest.raises(OSError):
+            range_file.read(4)
+
+
 ### Aggregated Table
 
 def test_aggregated_summary_arrow(case):
@@ -65,6 +164,22 @@ def test_aggregated_summary_pandas(case):
     assert isinstance(table["FOPT"].to_pandas(), pd.DataFrame)
 
 
+def test_aggregated_summary_columns(case):
+    """Test getting several columns of an aggregated table in one go"""
+    table = AggregatedTable(case, "summary", "eclipse", "iter-0")
+
+    arrow = table.to_arrow(["FOPT", "FOPR"])
+    assert isinstance(arrow, pa.Table)
+    assert arrow.column_names[-2:] == ["FOPT", "FOPR"]
+    assert "REAL" in arrow.column_names
+
+    frame = table.to_pandas(["FOPT"])
+    assert isinstance(frame, pd.DataFrame)
+
+    with pytest.raises(IndexError):
+        table.to_arrow(["FOPT", "banana"])
+
+
 def test_get_fmu_iteration_parameters(case):
     """Test getting the metadata of of an object"""
     table = AggregatedTable(case, "summary", "eclipse", "iter-0")